@@ -28,6 +28,7 @@ INITIAL_SEARCH_LIMIT = 20  # Reduced from 100 for faster initial search
 REQUEST_DELAY_SECONDS = 0.5  # Reduced from 1.1 for faster response
 MAX_RETRIES = 3  # Maximum retry attempts for API calls
 RETRY_BACKOFF_FACTOR = 2  # Exponential backoff multiplier
+MAX_DOWNLOAD_WORKERS = 4  # Concurrent PDF downloads (started at most one per REQUEST_DELAY_SECONDS overall)
 
 # Paper selection settings
 DEFAULT_MAX_PAPERS = 3
@@ -48,6 +49,9 @@ SEMANTIC_SCHOLAR_FIELDS: List[str] = [
 DATA_DIR = "./data"
 PAPERS_DIR = os.path.join(DATA_DIR, "papers")
 METADATA_FILE = os.path.join(DATA_DIR, "selected_papers.json")
+SEARCH_CACHE_DIR = os.path.join(DATA_DIR, "search_cache")
+SEARCH_CACHE_TTL_SECONDS = 24 * 60 * 60  # Cached search pages expire after a day
+EXTRACTION_CACHE_DIR = os.path.join(DATA_DIR, "extraction_cache")
 
 # Optional API key for higher rate limits
 SEMANTIC_SCHOLAR_API_KEY = os.getenv("SEMANTIC_SCHOLAR_API_KEY", "")
@@ -4,6 +4,7 @@ Generates structured drafts for Abstract, Methods, and Results sections.
 Now uses Google Gemini API exclusively.
 """
 
+import itertools
 import json
 import logging
 import re
@@ -22,6 +23,11 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+# Keywords that mark finding / implication sentences. Plain substrings, matched
+# against the lower-cased sentence, so each sentence is lower-cased only once
+_FINDING_KEYWORDS_RE = re.compile('found|showed|demonstrated|revealed|indicated|significant')
+_IMPLICATION_KEYWORDS_RE = re.compile('implication|suggest|recommend|future|limitation|potential')
+
 
 @dataclass
 class DraftSection:
@@ -257,13 +263,12 @@ class GPTDraftGenerator:
                     content = section.get('content', '')
                     # Extract key sentences
                     sentences = content.split('. ')
-                    important_sentences = [
-                        s for s in sentences 
-                        if any(keyword in s.lower() for keyword in 
-                              ['found', 'showed', 'demonstrated', 'revealed', 'indicated', 'significant'])
-                    ]
+                    # Only the first three are used, so stop testing sentences once found
+                    important_sentences = list(itertools.islice(
+                        (s for s in sentences if _FINDING_KEYWORDS_RE.search(s.lower())), 3
+                    ))
                     if important_sentences:
-                        paper_findings += "  Key findings: " + "; ".join(important_sentences[:3])
+                        paper_findings += "  Key findings: " + "; ".join(important_sentences)
                     break
             
             findings.append(paper_findings)
@@ -291,13 +296,12 @@ class GPTDraftGenerator:
                     content = section.get('content', '')
                     # Extract implication sentences
                     sentences = content.split('. ')
-                    imp_sentences = [
-                        s for s in sentences 
-                        if any(keyword in s.lower() for keyword in 
-                              ['implication', 'suggest', 'recommend', 'future', 'limitation', 'potential'])
-                    ]
+                    # Only the first two are used, so stop testing sentences once found
+                    imp_sentences = list(itertools.islice(
+                        (s for s in sentences if _IMPLICATION_KEYWORDS_RE.search(s.lower())), 2
+                    ))
                     if imp_sentences:
-                        paper_imp += "  Implications: " + "; ".join(imp_sentences[:2])
+                        paper_imp += "  Implications: " + "; ".join(imp_sentences)
                     break
             
             implications.append(paper_imp)
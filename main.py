@@ -6,6 +6,14 @@ import os
 from pathlib import Path
 from typing import List
 
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Fix Windows console encoding for Unicode characters
 from utils.encoding_fix import fix_console_encoding, safe_print
 fix_console_encoding()
@@ -25,22 +33,28 @@ from utils.helpers import ensure_directory
 
 logger = logging.getLogger(__name__)
 
+# Built once so the whole paper list is serialized in a single validator call
+_papers_adapter = TypeAdapter(List[PaperMetadata])
+
 
 def save_metadata(papers: List[PaperMetadata], filepath: str) -> None:
 
     ensure_directory(Path(filepath).parent)
     
     # Convert to dict format for JSON serialization
-    papers_data = []
-    for paper in papers:
-        paper_dict = paper.model_dump(mode='json', exclude_none=True)
+    papers_data = _papers_adapter.dump_python(papers, mode='json', exclude_none=True)
+    for paper_dict, paper in zip(papers_data, papers):
         # Add download status info
-        paper_dict["hasOpenAccessPdf"] = paper.has_open_pdf()
-        paper_dict["pdfUrl"] = paper.get_pdf_url()
-        papers_data.append(paper_dict)
+        pdf_url = paper.pdf_url
+        paper_dict["hasOpenAccessPdf"] = pdf_url is not None
+        paper_dict["pdfUrl"] = pdf_url
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(papers_data, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(papers_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(papers_data, f, indent=2, ensure_ascii=False)
     
     logger.info(f"Saved metadata for {len(papers)} papers to {filepath}")
 
@@ -78,6 +92,11 @@ def main():
         action="store_true",
         help="Generate lengthy APA-formatted draft after paper retrieval"
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached Semantic Scholar search results and fetch fresh ones"
+    )
     
     args = parser.parse_args()
     
@@ -102,17 +121,12 @@ def main():
     
     try:
         # Step 1: Search for papers
-        searcher = SemanticScholarSearcher()
-        print(f"Fetching up to {INITIAL_SEARCH_LIMIT} papers for ranking...")
-        papers = searcher.search_papers_paginated(topic, total_limit=INITIAL_SEARCH_LIMIT)
-        
-        if not papers:
-            print("No papers found for the given topic.")
-            sys.exit(1)
-        
+        searcher = SemanticScholarSearcher(refresh=args.refresh)
         selection_mode = "randomly selecting" if args.randomize else "selecting top"
-        print(f"Retrieved {len(papers)} papers, {selection_mode} {max_papers} "
-              f"(prioritizing open-access PDFs)...")
+        print(f"Fetching up to {INITIAL_SEARCH_LIMIT} papers for ranking, "
+              f"{selection_mode} {max_papers} (prioritizing open-access PDFs)...")
+        # Papers are streamed page by page straight into the selector
+        papers = searcher.iter_papers(topic, total_limit=INITIAL_SEARCH_LIMIT)
         
         # Step 2: Select top papers
         selector = PaperSelector()
@@ -125,7 +139,7 @@ def main():
         )
         
         if not selected_papers:
-            print("No papers selected.")
+            print("No papers found for the given topic.")
             sys.exit(1)
         
         papers_with_pdfs = sum(1 for p in selected_papers if p.has_open_pdf())
@@ -159,7 +173,7 @@ def main():
             for paper in selected_papers:
                 papers_data.append({
                     'title': paper.title,
-                    'authors': [author.name for author in (paper.authors or [])],
+                    'authors': paper.author_names,
                     'year': paper.year or 'n.d.',
                     'doi': paper.paperId  # Use paperId as DOI
                 })
@@ -191,14 +205,16 @@ def main():
         print(f"  - Metadata file: {METADATA_FILE}")
         print(f"  - PDFs directory: {PAPERS_DIR}")
         print(f"\nSelected papers:")
+        summary_lines = []
         for i, paper in enumerate(selected_papers, 1):
             pdf_status = "[PDF]" if paper.has_open_pdf() else "[No PDF]"
             year = paper.year or "N/A"
             citations = paper.citationCount or 0
-            # Use safe_print for Unicode characters
             title_preview = paper.title[:60]
-            safe_print(f"  {i}. {title_preview}...")
-            safe_print(f"     ({year}, {citations} citations, {pdf_status})")
+            summary_lines.append(f"  {i}. {title_preview}...")
+            summary_lines.append(f"     ({year}, {citations} citations, {pdf_status})")
+        # Use safe_print for Unicode characters; one write for the whole block
+        safe_print("\n".join(summary_lines))
         
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user.")
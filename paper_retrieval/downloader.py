@@ -3,19 +3,36 @@ PDF download functionality for open-access papers.
 """
 import os
 import logging
-import time
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
-from config import PAPERS_DIR, REQUEST_DELAY_SECONDS, MAX_RETRIES, RETRY_BACKOFF_FACTOR
+from config import (
+    PAPERS_DIR,
+    REQUEST_DELAY_SECONDS,
+    MAX_RETRIES,
+    RETRY_BACKOFF_FACTOR,
+    MAX_DOWNLOAD_WORKERS
+)
 from paper_retrieval.models import PaperMetadata
+from paper_retrieval.rate_limiter import JitteredRetry, TokenBucket
 from utils.helpers import generate_pdf_filename, ensure_directory
 
 logger = logging.getLogger(__name__)
 
+# Copy buffer for streaming PDF bodies to disk
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Larger files are skipped when the server reports their size up front
+MAX_PDF_SIZE_BYTES = 100 * 1024 * 1024
+
+# Download workers share one bucket, so REQUEST_DELAY_SECONDS spaces downloads
+# across all threads rather than per thread
+_download_rate_limiter = TokenBucket(rate=1.0 / REQUEST_DELAY_SECONDS, capacity=1)
+
 
 class PDFDownloader:
     """
@@ -34,11 +51,12 @@ class PDFDownloader:
         
         # Configure session with retries
         self.session = requests.Session()
-        retry_strategy = Retry(
+        retry_strategy = JitteredRetry(
             total=MAX_RETRIES,
             backoff_factor=RETRY_BACKOFF_FACTOR,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"]
+            allowed_methods=["GET"],
+            rate_limiter=_download_rate_limiter  # Retry-After also delays other downloads
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
@@ -48,6 +66,38 @@ class PDFDownloader:
             "User-Agent": "ResearchPaperReviewer/1.0"
         })
     
+    def _precheck_pdf_url(self, pdf_url: str) -> Optional[str]:
+        """
+        Check a PDF URL with a HEAD request before streaming the body.
+        
+        An oversized file is caught here without starting the GET at all. The
+        Content-Type alone isn't trusted to reject a URL: some publishers label
+        PDFs text/html, so the GET path's %PDF magic-byte check decides that.
+        
+        Args:
+            pdf_url: Open-access PDF URL
+            
+        Returns:
+            URL to GET (the final URL after redirects when HEAD succeeded),
+            or None if the file is too large to download
+        """
+        try:
+            head = self.session.head(pdf_url, allow_redirects=True, timeout=10)
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"HEAD request failed for {pdf_url}, falling back to GET: {e}")
+            return pdf_url
+        
+        if head.status_code >= 400:
+            # Some servers reject HEAD; let the GET path decide
+            return pdf_url
+        
+        content_length = head.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > MAX_PDF_SIZE_BYTES:
+            logger.warning(f"Skipping PDF larger than {MAX_PDF_SIZE_BYTES:,} bytes: {pdf_url}")
+            return None
+        
+        return head.url
+    
     def download_pdf(
         self,
         paper: PaperMetadata,
@@ -76,56 +126,67 @@ class PDFDownloader:
                 paper.year
             )
         
-        filepath = os.path.join(self.download_dir, filename)
+        filepath = Path(self.download_dir) / filename
         
         # Skip if file already exists
-        if os.path.exists(filepath):
+        if filepath.exists():
             logger.info(f"PDF already exists: {filename}")
-            return filepath
+            return str(filepath)
         
         try:
+            # Respect rate limits
+            _download_rate_limiter.acquire()
+            
+            pdf_url = self._precheck_pdf_url(pdf_url)
+            if not pdf_url:
+                return None
+            
             logger.info(f"Downloading PDF: {filename} from {pdf_url}")
             
-            response = self.session.get(pdf_url, timeout=60, stream=True)
-            response.raise_for_status()
+            # The context manager returns the streamed connection to the shared
+            # session's pool on every exit path, including the early return
+            with self.session.get(pdf_url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                # Let urllib3 undo any gzip/deflate transfer encoding on raw reads
+                response.raw.decode_content = True
             
-            # Verify it's actually a PDF
-            content_type = response.headers.get("Content-Type", "").lower()
-            if "pdf" not in content_type:
-                # Check first bytes for PDF magic number
-                first_bytes = response.content[:4]
-                if first_bytes != b"%PDF":
-                    logger.warning(
-                        f"URL does not appear to be a PDF (Content-Type: {content_type})"
-                    )
-                    return None
+                # Verify it's actually a PDF
+                content_type = response.headers.get("Content-Type", "").lower()
+                first_bytes = b""
+                if "pdf" not in content_type:
+                    # Check first bytes for PDF magic number without reading the whole body
+                    first_bytes = response.raw.read(4)
+                    if first_bytes != b"%PDF":
+                        logger.warning(
+                            f"URL does not appear to be a PDF (Content-Type: {content_type})"
+                        )
+                        return None
             
-            # Download and save
-            with open(filepath, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+                # Download and save; the copy loop runs in C with a large buffer
+                with open(filepath, "wb") as f:
+                    f.write(first_bytes)
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_BUFFER_SIZE)
+                    # Bytes written so far, without a separate stat of the finished file
+                    file_size = f.tell()
             
-            file_size = os.path.getsize(filepath)
             logger.info(f"Downloaded PDF: {filename} ({file_size:,} bytes)")
             
-            # Respect rate limits
-            time.sleep(REQUEST_DELAY_SECONDS)
-            
-            return filepath
+            return str(filepath)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to download PDF for {paper.title}: {e}")
-            # Clean up partial file if it exists
-            if os.path.exists(filepath):
-                try:
-                    os.remove(filepath)
-                except Exception:
-                    pass
-            return None
         except Exception as e:
+            # Includes urllib3 errors (ProtocolError, ReadTimeoutError, DecodeError)
+            # raised while streaming the body, which aren't RequestExceptions
             logger.error(f"Unexpected error downloading PDF: {e}")
-            return None
+        
+        # Clean up partial file if it exists; a truncated PDF left on disk would be
+        # taken as already downloaded by the next batch
+        try:
+            filepath.unlink(missing_ok=True)
+        except Exception:
+            pass
+        return None
     
     def download_papers(self, papers: List[PaperMetadata]) -> dict:
         """
@@ -146,6 +207,14 @@ class PDFDownloader:
         """
         results = {}
         
+        # List the directory once so resumed batches skip existing files
+        # without a stat per paper, a network round-trip, or a rate-limit sleep
+        download_dir = Path(self.download_dir)
+        existing_files = set(os.listdir(download_dir))
+        
+        # (paper, filename, result) for each PDF that still has to be fetched
+        pending = []
+        
         for paper in papers:
             paper_id = paper.paperId
             result = {
@@ -153,18 +222,34 @@ class PDFDownloader:
                 "filepath": None,
                 "error": None
             }
+            results[paper_id] = result
             
             if paper.has_open_pdf():
-                filepath = self.download_pdf(paper)
-                if filepath:
+                filename = generate_pdf_filename(paper.title, paper.authors, paper.year)
+                if filename in existing_files:
+                    logger.info(f"PDF already exists: {filename}")
                     result["downloaded"] = True
-                    result["filepath"] = filepath
+                    result["filepath"] = str(download_dir / filename)
                 else:
-                    result["error"] = "Download failed or not a valid PDF"
+                    pending.append((paper, filename, result))
             else:
                 result["error"] = "No open-access PDF available"
-            
-            results[paper_id] = result
+        
+        if pending:
+            # Downloads are network-bound, so threads overlap them despite the GIL;
+            # requests.Session is safe to share for concurrent GETs
+            max_workers = min(MAX_DOWNLOAD_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                filepaths = executor.map(
+                    lambda item: self.download_pdf(item[0], filename=item[1]),
+                    pending
+                )
+                for (_, _, result), filepath in zip(pending, filepaths):
+                    if filepath:
+                        result["downloaded"] = True
+                        result["filepath"] = filepath
+                    else:
+                        result["error"] = "Download failed or not a valid PDF"
         
         downloaded_count = sum(1 for r in results.values() if r["downloaded"])
         logger.info(f"Downloaded {downloaded_count} out of {len(papers)} papers")
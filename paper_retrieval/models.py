@@ -1,12 +1,21 @@
 """
 Pydantic models for paper metadata and API responses.
 """
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 
 
-class Author(BaseModel):
-    """Author information model."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Author:
+    """
+    Author information.
+    
+    A slotted dataclass rather than a BaseModel: papers carry many authors and
+    the data is just two strings. Pydantic still validates incoming dicts into
+    it when building PaperMetadata.
+    """
     authorId: Optional[str] = None
     name: str
 
@@ -36,15 +45,37 @@ class PaperMetadata(BaseModel):
             # Handle any special encoding if needed
         }
     
+    @cached_property
+    def pdf_url(self) -> Optional[str]:
+        """Open access PDF URL, computed once and reused by ranking, download and save."""
+        return self.openAccessPdf.url if self.openAccessPdf else None
+    
+    @cached_property
+    def author_names(self) -> List[str]:
+        """Author names, built once per paper."""
+        return [author.name for author in self.authors] if self.authors else []
+    
+    @cached_property
+    def rank_tuple(self) -> tuple:
+        """
+        Ranking key, computed once per paper: (has_pdf, citation_count, year)
+        - has_pdf: negated so papers with PDFs (-1) sort before those without (0)
+        - citation_count: negated so higher counts come first
+        - year: negated so recent papers are preferred
+        """
+        return (
+            -int(self.pdf_url is not None),
+            -(self.citationCount or 0),
+            -(self.year or 0)
+        )
+    
     def has_open_pdf(self) -> bool:
         """Check if paper has an open access PDF available."""
-        return self.openAccessPdf is not None and self.openAccessPdf.url is not None
+        return self.pdf_url is not None
     
     def get_pdf_url(self) -> Optional[str]:
         """Get the open access PDF URL if available."""
-        if self.has_open_pdf():
-            return self.openAccessPdf.url
-        return None
+        return self.pdf_url
 
 
 class SemanticScholarSearchResponse(BaseModel):
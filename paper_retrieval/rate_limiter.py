@@ -0,0 +1,99 @@
+"""
+Rate limiting and retry backoff helpers for API requests.
+"""
+import logging
+import random
+import threading
+import time
+from typing import Optional
+
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket using a monotonic clock.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Callers
+    that find a token available proceed immediately; otherwise they sleep only
+    as long as it takes for the next token to refill.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens the bucket can hold
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill. Caller must hold the lock."""
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def acquire(self) -> None:
+        """Take one token, sleeping only as long as needed for one to become available."""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+
+            logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
+            time.sleep(wait_time)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back all callers for at least `seconds`, e.g. after a Retry-After header.
+
+        Args:
+            seconds: Minimum time before the next token is handed out
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+
+class JitteredRetry(Retry):
+    """
+    urllib3 Retry with full-jitter backoff that reports Retry-After to a rate limiter.
+
+    Full jitter (a uniform random sleep between 0 and the exponential backoff)
+    keeps clients that hit a 429 at the same time from retrying in lockstep.
+    When the server sends Retry-After, the delay is also applied to the shared
+    token bucket so that the next fresh request backs off too, not only this retry.
+    """
+
+    def __init__(self, *args, rate_limiter: Optional[TokenBucket] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+
+    def new(self, **kw) -> "JitteredRetry":
+        # urllib3 rebuilds the Retry object on every attempt; carry the limiter over
+        retry = super().new(**kw)
+        retry.rate_limiter = self.rate_limiter
+        return retry
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+    def sleep_for_retry(self, response=None) -> bool:
+        if self.rate_limiter is not None and response is not None:
+            retry_after = self.get_retry_after(response)
+            if retry_after:
+                logger.warning(f"Server requested Retry-After: {retry_after:.1f} seconds")
+                self.rate_limiter.pause(retry_after)
+        return super().sleep_for_retry(response)
@@ -1,14 +1,22 @@
 """
 Semantic Scholar API search implementation with pagination support.
 """
+import hashlib
+import json
+import os
 import time
 import logging
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 import urllib3
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Disable SSL warnings for development (corporate networks/proxies)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -19,35 +27,69 @@ from config import (
     MAX_RESULTS_PER_REQUEST,
     REQUEST_DELAY_SECONDS,
     MAX_RETRIES,
-    RETRY_BACKOFF_FACTOR
+    RETRY_BACKOFF_FACTOR,
+    SEARCH_CACHE_DIR,
+    SEARCH_CACHE_TTL_SECONDS
 )
 from paper_retrieval.models import PaperMetadata, SemanticScholarSearchResponse
+from paper_retrieval.rate_limiter import JitteredRetry, TokenBucket
+from utils.helpers import ensure_directory
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections kept open to api.semanticscholar.org
+POOL_MAXSIZE = 10
 
-class SemanticScholarSearcher:
-    """
-    Handles searching and retrieving papers from Semantic Scholar API.
-    """
-    
-    def __init__(self):
-        """Initialize the searcher with a session configured for retries."""
-        self.session = requests.Session()
+# 1 RPS limit is cumulative across all endpoints, so every searcher shares one bucket
+_rate_limiter = TokenBucket(rate=1.0 / REQUEST_DELAY_SECONDS, capacity=1)
+
+# Session shared by every searcher so paginated and repeated searches reuse
+# pooled keep-alive connections instead of paying a new TCP+TLS handshake
+_shared_session: Optional[requests.Session] = None
+
+
+def _get_shared_session() -> requests.Session:
+    """Return the module-wide Semantic Scholar session, creating it on first use."""
+    global _shared_session
+    if _shared_session is None:
+        session = requests.Session()
         
         # Configure retry strategy
-        retry_strategy = Retry(
+        retry_strategy = JitteredRetry(
             total=MAX_RETRIES,
             backoff_factor=RETRY_BACKOFF_FACTOR,
             status_forcelist=[429, 500, 502, 503, 504],  # Rate limit and server errors
-            allowed_methods=["GET"]
+            allowed_methods=["GET"],
+            rate_limiter=_rate_limiter  # Retry-After also delays subsequent searches
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=1,  # Single host
+            pool_maxsize=POOL_MAXSIZE
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _shared_session = session
+    return _shared_session
+
+
+class SemanticScholarSearcher:
+    """
+    Handles searching and retrieving papers from Semantic Scholar API.
+    """
+    
+    def __init__(self, refresh: bool = False, cache_dir: str = SEARCH_CACHE_DIR):
+        """
+        Initialize the searcher with the shared, retry-configured session.
         
-        # Track last request time to enforce 1 RPS limit
-        self.last_request_time = 0.0
+        Args:
+            refresh: If True, ignore cached search pages and fetch fresh results
+            cache_dir: Directory for cached search responses
+        """
+        self.session = _get_shared_session()
+        self.rate_limiter = _rate_limiter
+        self.refresh = refresh
+        self.cache_dir = cache_dir
         
         # Set headers
         self.headers = {
@@ -59,6 +101,35 @@ class SemanticScholarSearcher:
         else:
             logger.info("No API key provided - using unauthenticated access (shared rate limit)")
     
+    def _cache_path(self, params: Dict[str, Any]) -> str:
+        """Build the cache file path for a search request (query, limit, offset, fields)."""
+        key = json.dumps(params, sort_keys=True).encode("utf-8")
+        return os.path.join(self.cache_dir, f"{hashlib.sha256(key).hexdigest()}.json")
+    
+    def _load_cached_response(self, cache_path: str) -> Optional[Dict[str, Any]]:
+        """Return a cached API response if present and younger than the TTL."""
+        if self.refresh:
+            return None
+        try:
+            if time.time() - os.path.getmtime(cache_path) > SEARCH_CACHE_TTL_SECONDS:
+                return None
+            with open(cache_path, "rb") as f:
+                raw = f.read()
+            return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_cached_response(self, cache_path: str, data: Dict[str, Any]) -> None:
+        """Write an API response to the cache atomically; failures are non-fatal."""
+        try:
+            ensure_directory(self.cache_dir)
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(data) if ORJSON_AVAILABLE else json.dumps(data).encode("utf-8"))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache search response: {e}")
+    
     def search_papers(
         self,
         query: str,
@@ -91,18 +162,55 @@ class SemanticScholarSearcher:
         
         logger.info(f"Searching Semantic Scholar: query='{query}', limit={limit}, offset={offset}")
         
+        # Serve repeated searches from the on-disk cache when possible
+        cache_path = self._cache_path(params)
+        data = self._load_cached_response(cache_path)
+        if data is not None:
+            logger.info("Using cached search results")
+        else:
+            data = self._request_search_page(params)
+            if data is None:
+                return SemanticScholarSearchResponse(total=0, offset=offset, data=[])
+            self._save_cached_response(cache_path, data)
+        
+        # Parse response into models
+        papers = []
+        for paper_data in data.get("data", []):
+            try:
+                paper = PaperMetadata(**paper_data)
+                papers.append(paper)
+            except Exception as e:
+                logger.warning(f"Failed to parse paper data: {e}")
+                continue
+        
+        result = SemanticScholarSearchResponse(
+            total=data.get("total", len(papers)),
+            offset=data.get("offset", offset),
+            data=papers
+        )
+        
+        logger.info(f"Retrieved {len(papers)} papers from Semantic Scholar")
+        return result
+    
+    def _request_search_page(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one page of search results from the API.
+        
+        Args:
+            params: Query parameters for the search endpoint
+            
+        Returns:
+            Decoded JSON response, or None if the body was empty or not valid JSON
+            
+        Raises:
+            requests.RequestException: If API request fails
+        """
         # Enforce 1 RPS rate limit (cumulative across all endpoints)
         if SEMANTIC_SCHOLAR_API_KEY:
-            current_time = time.time()
-            time_since_last_request = current_time - self.last_request_time
-            if time_since_last_request < REQUEST_DELAY_SECONDS:
-                sleep_time = REQUEST_DELAY_SECONDS - time_since_last_request
-                logger.debug(f"Rate limiting: waiting {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
+            self.rate_limiter.acquire()
         
         try:
             # Make the request (SSL verification disabled for development)
-            request_start_time = time.time()
             response = self.session.get(
                 SEMANTIC_SCHOLAR_SEARCH_ENDPOINT,
                 params=params,
@@ -111,66 +219,41 @@ class SemanticScholarSearcher:
                 verify=False  # Disable SSL verification for corporate networks/proxies
             )
             response.raise_for_status()
-            
-            # Update last request time after request completes (for accurate rate limiting)
-            if SEMANTIC_SCHOLAR_API_KEY:
-                self.last_request_time = time.time()
-            
-            # Check if response has content
-            if not response.text or response.text.strip() == '':
-                logger.error("API returned empty response")
-                return SemanticScholarSearchResponse(total=0, offset=offset, data=[])
-            
-            # Try to parse JSON
-            try:
-                data = response.json()
-            except ValueError as json_error:
-                logger.error(f"Failed to parse JSON response: {json_error}")
-                logger.error(f"Response text (first 500 chars): {response.text[:500]}")
-                return SemanticScholarSearchResponse(total=0, offset=offset, data=[])
-            
-            # Parse response into models
-            papers = []
-            for paper_data in data.get("data", []):
-                try:
-                    paper = PaperMetadata(**paper_data)
-                    papers.append(paper)
-                except Exception as e:
-                    logger.warning(f"Failed to parse paper data: {e}")
-                    continue
-            
-            result = SemanticScholarSearchResponse(
-                total=data.get("total", len(papers)),
-                offset=data.get("offset", offset),
-                data=papers
-            )
-            
-            logger.info(f"Retrieved {len(papers)} papers from Semantic Scholar")
-            return result
-            
         except requests.exceptions.RequestException as e:
-            # Update timestamp even on error to avoid rate limit issues
-            if SEMANTIC_SCHOLAR_API_KEY:
-                self.last_request_time = time.time()
             logger.error(f"API request failed: {e}")
             raise
+        
+        # Check if response has content
+        if not response.text or response.text.strip() == '':
+            logger.error("API returned empty response")
+            return None
+        
+        # Try to parse JSON
+        try:
+            return orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+        except ValueError as json_error:
+            logger.error(f"Failed to parse JSON response: {json_error}")
+            logger.error(f"Response text (first 500 chars): {response.text[:500]}")
+            return None
     
-    def search_papers_paginated(
+    def iter_papers(
         self,
         query: str,
         total_limit: int = MAX_RESULTS_PER_REQUEST
-    ) -> List[PaperMetadata]:
+    ) -> Iterator[PaperMetadata]:
         """
-        Search for papers with automatic pagination to fetch more results.
+        Stream papers page by page, yielding each one as soon as its page arrives.
+        
+        Callers that only keep the best few results can consume this lazily
+        instead of holding every retrieved paper in memory.
         
         Args:
             query: Search query string
             total_limit: Total number of papers to retrieve (may require multiple requests)
             
-        Returns:
-            List of PaperMetadata objects
+        Yields:
+            PaperMetadata objects in API relevance order
         """
-        all_papers = []
         offset = 0
         remaining = total_limit
         
@@ -180,29 +263,43 @@ class SemanticScholarSearcher:
             
             try:
                 response = self.search_papers(query, limit=request_limit, offset=offset)
-                papers = response.data
-                
-                if not papers:
-                    logger.info("No more papers available")
-                    break
-                
-                all_papers.extend(papers)
-                remaining -= len(papers)
-                offset += len(papers)
-                
-                # If we got fewer results than requested, we've reached the end
-                if len(papers) < request_limit:
-                    logger.info("Reached end of available results")
-                    break
-                
-                # Rate limiting is handled in search_papers() method
-                # No additional delay needed here
-                    
             except requests.exceptions.RequestException as e:
                 logger.error(f"Error during paginated search: {e}")
                 # Continue with what we have so far
                 break
+            
+            papers = response.data[:remaining]  # Ensure we don't exceed the limit
+            if not papers:
+                logger.info("No more papers available")
+                break
+            
+            yield from papers
+            remaining -= len(papers)
+            offset += len(papers)
+            
+            # If we got fewer results than requested, we've reached the end
+            if len(papers) < request_limit:
+                logger.info("Reached end of available results")
+                break
+            
+            # Rate limiting is handled in search_papers() method
+            # No additional delay needed here
         
-        logger.info(f"Total papers retrieved via pagination: {len(all_papers)}")
-        return all_papers[:total_limit]  # Ensure we don't exceed the limit
-
+        logger.info(f"Total papers retrieved via pagination: {offset}")
+    
+    def search_papers_paginated(
+        self,
+        query: str,
+        total_limit: int = MAX_RESULTS_PER_REQUEST
+    ) -> List[PaperMetadata]:
+        """
+        Search for papers with automatic pagination to fetch more results.
+        
+        Args:
+            query: Search query string
+            total_limit: Total number of papers to retrieve (may require multiple requests)
+            
+        Returns:
+            List of PaperMetadata objects
+        """
+        return list(self.iter_papers(query, total_limit=total_limit))
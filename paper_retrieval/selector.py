@@ -1,13 +1,18 @@
 """
 Paper selection and ranking logic.
 """
+import heapq
 import logging
 import random
-from typing import List
+from operator import attrgetter
+from typing import Iterable, List, Optional
 from paper_retrieval.models import PaperMetadata
 
 logger = logging.getLogger(__name__)
 
+# Sort key: the cached (has_pdf, citation_count, year) tuple on each paper
+sort_key = attrgetter("rank_tuple")
+
 
 class PaperSelector:
     """
@@ -15,7 +20,10 @@ class PaperSelector:
     """
     
     @staticmethod
-    def rank_papers(papers: List[PaperMetadata]) -> List[PaperMetadata]:
+    def rank_papers(
+        papers: Iterable[PaperMetadata],
+        limit: Optional[int] = None
+    ) -> List[PaperMetadata]:
         """
         Rank papers by: relevance (already sorted by API) → citationCount → year → openAccessPdf.
         
@@ -23,36 +31,24 @@ class PaperSelector:
         so we maintain that order but then refine by other criteria.
         
         Args:
-            papers: List of papers to rank
+            papers: Papers to rank (a list or a lazily streamed iterable)
+            limit: If given, only the top `limit` papers are kept, so a streamed
+                   input never has to be held in memory in full
             
         Returns:
             Ranked list of papers
         """
-        if not papers:
-            return []
-        
-        def sort_key(paper: PaperMetadata) -> tuple:
-            """
-            Sort key: (has_pdf, citation_count, year)
-            - has_pdf: False (0) comes before True (1), so we negate to prioritize True
-            - citation_count: Higher is better (descending)
-            - year: Higher is better (descending, recent papers preferred)
-            """
-            has_pdf = 1 if paper.has_open_pdf() else 0
-            citation_count = paper.citationCount or 0
-            year = paper.year or 0
-            
-            # Negate has_pdf so True (1) becomes -1, which sorts before False (0)
-            # This means papers with PDFs come first
-            return (-has_pdf, -citation_count, -year)
-        
-        ranked = sorted(papers, key=sort_key)
+        if limit is not None:
+            # heapq.nsmallest is stable, so API relevance order breaks ties
+            ranked = heapq.nsmallest(limit, papers, key=sort_key)
+        else:
+            ranked = sorted(papers, key=sort_key)
         logger.info(f"Ranked {len(ranked)} papers")
         return ranked
     
     @staticmethod
     def select_papers(
-        papers: List[PaperMetadata],
+        papers: Iterable[PaperMetadata],
         max_papers: int,
         prioritize_pdfs: bool = True,
         randomize: bool = False,
@@ -62,7 +58,7 @@ class PaperSelector:
         Select top papers based on ranking, with optional PDF prioritization.
         
         Args:
-            papers: List of papers to select from
+            papers: Papers to select from (a list or a lazily streamed iterable)
             max_papers: Maximum number of papers to select
             prioritize_pdfs: If True, prefer papers with open-access PDFs
             randomize: If True, randomly select from top-ranked papers instead of always top N
@@ -72,27 +68,34 @@ class PaperSelector:
         Returns:
             Selected list of papers
         """
-        if not papers:
-            logger.warning("No papers provided for selection")
-            return []
-        
-        # Rank papers
-        ranked = PaperSelector.rank_papers(papers)
-        
-        if randomize and len(ranked) > max_papers:
+        if randomize:
+            # The diversity pool is sized from the total count, so materialize
+            papers = list(papers)
             # Select from a wider pool for diversity
             # diversity_factor determines how far down the list we look
             # 0.0 = only top papers, 1.0 = entire list
             pool_size = max(
                 max_papers,
-                int(len(ranked) * (0.1 + 0.9 * diversity_factor))  # At least top 10%, up to 100%
+                int(len(papers) * (0.1 + 0.9 * diversity_factor))  # At least top 10%, up to 100%
             )
-            pool = ranked[:pool_size]
-            selected = random.sample(pool, min(max_papers, len(pool)))
+        else:
+            pool_size = max_papers
+        
+        # Only the top pool_size papers are ever needed, so skip the full sort
+        pool = PaperSelector.rank_papers(papers, limit=pool_size)
+        
+        if not pool:
+            logger.warning("No papers provided for selection")
+            return []
+        
+        if randomize and len(papers) > max_papers:
+            # Sample positions rather than papers so the pool itself is never copied
+            picks = random.sample(range(len(pool)), min(max_papers, len(pool)))
+            selected = [pool[i] for i in picks]
             logger.info(f"Randomly selected {len(selected)} papers from top {pool_size} ranked papers")
         else:
             # Select top papers (deterministic)
-            selected = ranked[:max_papers]
+            selected = pool[:max_papers]
         
         # Count papers with PDFs
         papers_with_pdfs = sum(1 for p in selected if p.has_open_pdf())
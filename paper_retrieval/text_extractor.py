@@ -3,10 +3,279 @@ Text extraction module for parsing PDFs using PyMuPDF.
 """
 
 import fitz  # PyMuPDF
+import hashlib
+import io
 import logging
+import mmap
+import os
+import shutil
+import tempfile
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, IO, Iterable, Iterator, List, Tuple
 import json
+import re
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from config import EXTRACTION_CACHE_DIR
+
+# Upper bound on extraction results in flight per worker, so large batches
+# don't queue thousands of finished documents waiting to be collected
+MAX_CONCURRENT_RESULTS_PER_WORKER = 2
+
+# Documents with at least this many pages have their pages split across
+# worker processes, in blocks of PAGES_PER_CHUNK pages
+PARALLEL_PAGE_THRESHOLD = 200
+PAGES_PER_CHUNK = 50
+
+# Common patterns for abstract sections
+ABSTRACT_START_PATTERNS = (
+    'abstract',
+    'a b s t r a c t',
+    'summary',
+    'introduction'  # Sometimes abstract is under introduction
+)
+
+# Patterns that end the abstract
+ABSTRACT_END_PATTERNS = (
+    'keywords:',
+    'key words:',
+    'introduction',
+    '1.',
+    'i.',
+    'methodology',
+    'methods',
+    'results'
+)
+
+
+def _get_max_workers(num_files: int) -> int:
+    """Number of extraction processes for a batch: one per file, capped at the CPU count."""
+    return max(1, min(num_files, os.cpu_count() or 1))
+
+
+@contextmanager
+def _open_pdf(pdf_path) -> Iterator["fitz.Document"]:
+    """
+    Open a PDF through a read-only memory map of the file.
+    
+    MuPDF reads straight from the OS page cache instead of its own copy of the
+    file, and reopening a recently read PDF costs almost nothing. The document,
+    the buffer view and the mapping are released in that order on exit.
+    """
+    with open(pdf_path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with mapped, memoryview(mapped) as view, fitz.open(stream=view, filetype="pdf") as doc:
+        yield doc
+
+
+def _list_pdfs(directory) -> List[str]:
+    """
+    Paths of the PDF files directly inside a directory, sorted by path.
+    
+    Uses os.scandir rather than Path.glob to avoid a Path object per entry; the
+    sorted order keeps batch runs deterministic across filesystems.
+    """
+    with os.scandir(directory) as entries:
+        return sorted(entry.path for entry in entries if entry.name.endswith('.pdf') and entry.is_file())
+
+
+def _stem(path: str) -> str:
+    """File name without its extension, like Path.stem."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _iter_page_range(doc: "fitz.Document", start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield the text of pages [start, stop) using PyMuPDF's page iterator.
+    
+    Each page is dropped before the next one is loaded, so MuPDF can release
+    its resources right away instead of whenever the Page object is collected.
+    """
+    for page in doc.pages(start, stop):
+        page_text = page.get_text()
+        del page
+        yield page_text
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of pages [start, stop) in a worker process.
+    
+    PyMuPDF documents are not thread-safe, so each worker opens its own copy.
+    """
+    with _open_pdf(pdf_path) as doc:
+        return list(_iter_page_range(doc, start, stop))
+
+
+def _extract_one(pdf_path: str, output_path: Optional[str], format: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract one PDF and optionally save it. Module-level so worker processes can unpickle it.
+    
+    TXT output is streamed page by page, in which case the returned data is the
+    summary from extract_to_text_file (metadata, word counts and abstract, no full
+    text), whether or not the extraction cache was hit.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        output_path (Optional[str]): Where to save the extracted data, or None to skip saving
+        format (str): Output format - "json" or "txt"
+        
+    Returns:
+        Optional[Dict[str, Any]]: Extracted data or None if extraction failed
+    """
+    # Already running one process per file, so don't fan out per page as well
+    extractor = PDFTextExtractor(page_workers=1)
+    if output_path and format.lower() == "txt":
+        return extractor.extract_to_text_file(pdf_path, output_path)
+    extracted_data = extractor.extract_text_from_pdf(pdf_path)
+    if extracted_data and output_path:
+        extractor.save_extracted_data(extracted_data, output_path, format)
+    return extracted_data
+
+
+class _AbstractScanner:
+    """
+    Incremental abstract detection over the lines of a document.
+    
+    Lines are fed in document order, either all at once or as text chunks while
+    the document is being written out, so the full text never has to be held.
+    """
+    
+    # Longer candidates are probably not the abstract
+    MAX_ABSTRACT_LENGTH = 2000
+    
+    def __init__(self, start_re: "re.Pattern", end_re: "re.Pattern"):
+        self._start_re = start_re
+        self._end_re = end_re
+        self._lines: List[str] = []
+        self._length = -1  # Length of ' '.join(self._lines)
+        self._found = False
+        self._partial = ''
+        self.done = False
+    
+    def feed_lines(self, lines: Iterable[str]) -> None:
+        """Scan complete lines, stopping as soon as the abstract has ended."""
+        for line in lines:
+            if self.done:
+                break
+            line_stripped = line.strip()
+            line_lower = line_stripped.lower()
+            
+            # Check if we found the start of abstract
+            if self._start_re.search(line_lower):
+                self._found = True
+                # Skip the abstract header line
+                continue
+                
+            # If we found abstract, collect lines until we hit an end pattern
+            if self._found:
+                if self._end_re.search(line_lower):
+                    self.done = True
+                elif line_stripped:  # Skip empty lines
+                    self._lines.append(line_stripped)
+                    self._length += len(line_stripped) + 1
+                    if self._length > self.MAX_ABSTRACT_LENGTH:
+                        # Can only grow from here, so the result is already decided
+                        self.done = True
+    
+    def feed_text(self, text: str) -> None:
+        """Scan a chunk of text whose last line may continue in the next chunk."""
+        if self.done:
+            return
+        lines = (self._partial + text).split('\n')
+        self._partial = lines.pop()
+        self.feed_lines(lines)
+    
+    def result(self) -> Optional[str]:
+        """Return the abstract, or None if none was found or it is implausibly long."""
+        if self._partial:
+            self.feed_lines([self._partial])
+            self._partial = ''
+        if self._length > self.MAX_ABSTRACT_LENGTH:
+            return None
+        abstract = ' '.join(self._lines)
+        return abstract if abstract else None
+
+
+class _CacheEntryWriter:
+    """
+    Write an extraction cache entry incrementally, while a TXT export is streamed.
+    
+    Produces the JSON that _save_cached writes for an extract_text_from_pdf result
+    (per-page dicts, same key order) without holding the document in memory:
+    full_text is written into the entry as it goes, and the page dicts, which come
+    after it, are spooled to a temporary file and appended at the end. Write
+    errors only drop the cache entry, they never fail the extraction.
+    """
+    
+    def __init__(self, cache_path: Path, metadata: Dict[str, Any], logger: logging.Logger):
+        self._cache_path = cache_path
+        self._tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        self._logger = logger
+        self._entry = None
+        self._pages = None
+        self._page_count = 0
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._entry = open(self._tmp_path, 'w', encoding='utf-8')
+            self._pages = tempfile.TemporaryFile('w+', encoding='utf-8')
+            self._entry.write(f'{{"metadata": {json.dumps(metadata, ensure_ascii=False)}, "full_text": "')
+        except OSError as e:
+            self._fail(e)
+    
+    def _fail(self, error: OSError) -> None:
+        self._logger.warning(f"Failed to cache extraction result: {str(error)}")
+        self.discard()
+    
+    def add_page(self, text_piece: str, page_text: str, word_count: int) -> None:
+        """Append the next piece of full_text and the page dict of the same page."""
+        if self._entry is None:
+            return
+        try:
+            # JSON escaping is per character, so escaped pieces concatenate into one string
+            self._entry.write(json.dumps(text_piece, ensure_ascii=False)[1:-1])
+            self._page_count += 1
+            page = {'page_number': self._page_count, 'text': page_text, 'word_count': word_count}
+            self._pages.write((', ' if self._page_count > 1 else '') + json.dumps(page, ensure_ascii=False))
+        except OSError as e:
+            self._fail(e)
+    
+    def finish(self, total_words: int, abstract: Optional[str]) -> None:
+        """Complete the entry and move it into place atomically."""
+        if self._entry is None:
+            return
+        try:
+            self._entry.write('", "page_texts": [')
+            self._pages.seek(0)
+            shutil.copyfileobj(self._pages, self._entry)
+            self._entry.write(f'], "total_words": {total_words}, "extraction_success": true, '
+                              f'"abstract": {json.dumps(abstract, ensure_ascii=False)}}}')
+            self._entry.close()
+            self._pages.close()
+            self._entry = self._pages = None
+            os.replace(self._tmp_path, self._cache_path)
+        except OSError as e:
+            self._fail(e)
+    
+    def discard(self) -> None:
+        """Drop an unfinished entry (no-op once finished)."""
+        if self._entry is None:
+            return
+        self._entry.close()
+        self._pages.close()
+        self._entry = self._pages = None
+        try:
+            self._tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
 
 
 class PDFTextExtractor:
@@ -14,69 +283,178 @@ class PDFTextExtractor:
     A class to extract text and metadata from PDF files using PyMuPDF.
     """
     
-    def __init__(self):
-        """Initialize the PDF text extractor."""
+    def __init__(self, page_workers: int = 1,
+                 cache_dir: Optional[str] = EXTRACTION_CACHE_DIR):
+        """
+        Initialize the PDF text extractor.
+        
+        Args:
+            page_workers (int): Worker processes for splitting the pages of large
+                                PDFs; the default of 1 keeps extraction in-process
+            cache_dir (Optional[str]): Directory for cached extraction results; None disables caching
+        """
         self.logger = logging.getLogger(__name__)
+        self.page_workers = max(1, page_workers)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        
+        # Abstract start/end markers, one compiled alternation each. Plain substrings,
+        # as before, matched against the lower-cased line
+        self._abstract_start_re = re.compile('|'.join(map(re.escape, ABSTRACT_START_PATTERNS)))
+        self._abstract_end_re = re.compile('|'.join(map(re.escape, ABSTRACT_END_PATTERNS)))
+    
+    def _cache_path(self, pdf_path: Path, compact: bool = False) -> Optional[Path]:
+        """
+        Cache file for a PDF, keyed by its resolved path, modification time and size.
+        
+        Any change to the file produces a new key, so stale entries are never returned.
+        Compact and per-page-dict results are cached separately.
+        """
+        if self.cache_dir is None:
+            return None
+        stat = pdf_path.stat()
+        key = f"{pdf_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+        if compact:
+            key += ":compact"
+        return self.cache_dir / f"{hashlib.md5(key.encode('utf-8')).hexdigest()}.json"
+    
+    def _load_cached(self, cache_path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        """Return a cached extraction result, or None on a miss or unreadable entry."""
+        if cache_path is None or not cache_path.exists():
+            return None
+        try:
+            if ORJSON_AVAILABLE:
+                with open(cache_path, 'rb') as f:
+                    return orjson.loads(f.read())
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable extraction cache {cache_path}: {str(e)}")
+            return None
+    
+    def _save_cached(self, cache_path: Optional[Path], result: Dict[str, Any]) -> None:
+        """Write an extraction result to the cache atomically; failures are non-fatal."""
+        if cache_path is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            if ORJSON_AVAILABLE:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Failed to cache extraction result: {str(e)}")
+    
+    def _extract_pages_parallel(self, pdf_path: str, page_count: int) -> Iterator[str]:
+        """
+        Extract all page texts of a large PDF using blocks of pages per worker process.
         
-    def extract_text_from_pdf(self, pdf_path: str) -> Optional[Dict[str, Any]]:
+        Args:
+            pdf_path (str): Path to the PDF file
+            page_count (int): Number of pages in the document
+            
+        Yields:
+            str: Text of every page, in page order, as each block completes
+        """
+        starts = range(0, page_count, PAGES_PER_CHUNK)
+        stops = [min(start + PAGES_PER_CHUNK, page_count) for start in starts]
+        max_workers = min(self.page_workers, len(stops))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for chunk in executor.map(_extract_page_range, [pdf_path] * len(stops), starts, stops):
+                yield from chunk
+    
+    def _document_metadata(self, doc: "fitz.Document", pdf_path: Path) -> Dict[str, Any]:
+        """PDF metadata plus page count, file size and file name."""
+        metadata = doc.metadata
+        metadata.update({
+            'page_count': doc.page_count,
+            'file_size': pdf_path.stat().st_size,
+            'file_name': pdf_path.name
+        })
+        return metadata
+    
+    def _iter_page_texts(self, doc: "fitz.Document", pdf_path: Path) -> Iterator[str]:
+        """Yield the text of each page in order, splitting large documents across processes."""
+        if self.page_workers > 1 and doc.page_count >= PARALLEL_PAGE_THRESHOLD:
+            return self._extract_pages_parallel(str(pdf_path), doc.page_count)
+        return _iter_page_range(doc)
+        
+    def extract_text_from_pdf(self, pdf_path: str, force_refresh: bool = False,
+                              compact: bool = False) -> Optional[Dict[str, Any]]:
         """
         Extract text and metadata from a PDF file.
         
+        Results are cached per file version, so repeated calls on an unchanged
+        PDF return the cached extraction instead of re-parsing it.
+        
+        By default pages are returned as 'page_texts', a list of
+        {'page_number', 'text', 'word_count'} dicts. With compact=True they are
+        returned as parallel lists instead: 'texts' and 'word_counts', numbered
+        from 'page_numbers_start'. This avoids a dict per page and gives smaller JSON.
+        
         Args:
             pdf_path (str): Path to the PDF file
+            force_refresh (bool): Re-extract even if a cached result exists
+            compact (bool): Return pages as parallel lists instead of per-page dicts
             
         Returns:
-            Optional[Dict[str, Any]]: Dictionary containing extracted text and metadata,
-                                     or None if extraction fails
+            Optional[Dict[str, Any]]: Dictionary containing extracted text, metadata and
+                                     the detected abstract (or None), or None if extraction fails
         """
         try:
             pdf_path = Path(pdf_path)
             if not pdf_path.exists():
                 self.logger.error(f"PDF file not found: {pdf_path}")
                 return None
-                
-            # Open the PDF file
-            doc = fitz.open(str(pdf_path))
-            
-            # Extract metadata
-            metadata = doc.metadata
-            metadata.update({
-                'page_count': doc.page_count,
-                'file_size': pdf_path.stat().st_size,
-                'file_name': pdf_path.name
-            })
             
-            # Extract text from all pages
-            full_text = ""
-            page_texts = []
-            
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                page_text = page.get_text()
+            cache_path = self._cache_path(pdf_path, compact)
+            if not force_refresh:
+                cached = self._load_cached(cache_path)
+                if cached is not None:
+                    self.logger.info(f"Loaded cached extraction for {pdf_path.name}")
+                    return cached
                 
-                # Store page-specific text
-                page_texts.append({
-                    'page_number': page_num + 1,
-                    'text': page_text,
-                    'word_count': len(page_text.split())
-                })
+            # Open the PDF file (closed when the block exits)
+            with _open_pdf(pdf_path) as doc:
+                # Extract metadata
+                metadata = self._document_metadata(doc, pdf_path)
                 
-                # Add to full text
-                full_text += f"\n--- Page {page_num + 1} ---\n"
-                full_text += page_text
-                full_text += "\n"
+                # Extract text from all pages
+                text_parts = []
+                texts = []
+                word_counts = []
+                
+                for page_num, page_text in enumerate(self._iter_page_texts(doc, pdf_path)):
+                    # Store page-specific text
+                    texts.append(page_text)
+                    word_counts.append(len(page_text.split()))
+                    
+                    # Add to full text (joined once after the loop)
+                    text_parts.append(f"\n--- Page {page_num + 1} ---\n{page_text}\n")
             
-            # Close the document
-            doc.close()
+            if compact:
+                pages = {'page_numbers_start': 1, 'texts': texts, 'word_counts': word_counts}
+            else:
+                pages = {'page_texts': [
+                    {'page_number': page_number, 'text': page_text, 'word_count': word_count}
+                    for page_number, (page_text, word_count) in enumerate(zip(texts, word_counts), start=1)
+                ]}
             
             # Prepare result
             result = {
                 'metadata': metadata,
-                'full_text': full_text.strip(),
-                'page_texts': page_texts,
-                'total_words': len(full_text.split()),
+                'full_text': "".join(text_parts).strip(),
+                **pages,
+                'total_words': sum(word_counts),
                 'extraction_success': True
             }
+            # Found once here so saving doesn't have to rescan the text
+            result['abstract'] = self.extract_abstract(result)
+            
+            self._save_cached(cache_path, result)
             
             self.logger.info(f"Successfully extracted text from {pdf_path.name}")
             return result
@@ -85,67 +463,167 @@ class PDFTextExtractor:
             self.logger.error(f"Error extracting text from {pdf_path}: {str(e)}")
             return None
     
-    def extract_abstract(self, extracted_data: Dict[str, Any]) -> Optional[str]:
+    def extract_and_write(self, pdf_path: str, out_fp: IO[str],
+                          cache_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
         """
-        Attempt to extract the abstract from the extracted text.
+        Extract a PDF and write it to an open text file in TXT format, page by page.
+        
+        The output is identical to save_extracted_data(..., format="txt"), but each
+        page is written as soon as it is extracted, so only one page of text is held
+        in memory at a time. With a cache_path, the extraction cache entry is
+        written alongside in the same streaming fashion.
         
         Args:
-            extracted_data (Dict[str, Any]): Data from extract_text_from_pdf
+            pdf_path (str): Path to the PDF file
+            out_fp (IO[str]): Text file object to write to
+            cache_path (Optional[Path]): Extraction cache entry to fill, or None to skip caching
             
         Returns:
-            Optional[str]: Extracted abstract or None if not found
+            Optional[Dict[str, Any]]: Summary with 'metadata', 'page_word_counts',
+                                     'total_words', 'abstract' and 'extraction_success'
+                                     (no full text), or None if extraction fails
         """
-        if not extracted_data or 'full_text' not in extracted_data:
-            return None
+        cache_writer = None
+        try:
+            pdf_path = Path(pdf_path)
+            if not pdf_path.exists():
+                self.logger.error(f"PDF file not found: {pdf_path}")
+                return None
             
-        text = extracted_data['full_text'].lower()
-        
-        # Common patterns for abstract sections
-        abstract_patterns = [
-            'abstract',
-            'a b s t r a c t',
-            'summary',
-            'introduction'  # Sometimes abstract is under introduction
-        ]
+            with _open_pdf(pdf_path) as doc:
+                metadata = self._document_metadata(doc, pdf_path)
+                out_fp.write(self._txt_header(metadata))
+                if cache_path is not None:
+                    cache_writer = _CacheEntryWriter(cache_path, metadata, self.logger)
+                
+                scanner = _AbstractScanner(self._abstract_start_re, self._abstract_end_re)
+                page_word_counts = []
+                # Whitespace held back so the written text matches full_text.strip()
+                pending_ws = None
+                
+                for page_num, page_text in enumerate(self._iter_page_texts(doc, pdf_path)):
+                    word_count = len(page_text.split())
+                    page_word_counts.append(word_count)
+                    
+                    block = f"\n--- Page {page_num + 1} ---\n{page_text}\n"
+                    content = block.rstrip()
+                    if pending_ws is None:
+                        content = content.lstrip()
+                    else:
+                        content = pending_ws + content
+                    pending_ws = block[len(block.rstrip()):]
+                    
+                    out_fp.write(content)
+                    scanner.feed_text(content)
+                    if cache_writer is not None:
+                        cache_writer.add_page(content, page_text, word_count)
+            
+            abstract = scanner.result()
+            if abstract:
+                out_fp.write(self._txt_abstract(abstract))
+            
+            total_words = sum(page_word_counts)
+            if cache_writer is not None:
+                cache_writer.finish(total_words, abstract)
+            
+            self.logger.info(f"Successfully extracted text from {pdf_path.name}")
+            return {
+                'metadata': metadata,
+                'page_word_counts': page_word_counts,
+                'total_words': total_words,
+                'abstract': abstract,
+                'extraction_success': True
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error extracting text from {pdf_path}: {str(e)}")
+            return None
+        finally:
+            if cache_writer is not None:
+                cache_writer.discard()
+    
+    def extract_to_text_file(self, pdf_path: str, output_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract a PDF straight to a TXT file without building the full text in memory.
         
-        lines = extracted_data['full_text'].split('\n')
-        abstract_lines = []
-        abstract_found = False
-        abstract_end_patterns = [
-            'keywords:',
-            'key words:',
-            'introduction',
-            '1.',
-            'i.',
-            'methodology',
-            'methods',
-            'results'
-        ]
+        If a cached extraction exists it is written out instead of re-parsing the PDF;
+        otherwise the cache entry is filled while the PDF is streamed.
         
-        for line in lines:
-            line_lower = line.strip().lower()
+        Args:
+            pdf_path (str): Path to the PDF file
+            output_path (str): Path of the TXT file to write
             
-            # Check if we found the start of abstract
-            if any(pattern in line_lower for pattern in abstract_patterns):
-                abstract_found = True
-                # Skip the abstract header line
-                continue
-                
-            # If we found abstract, collect lines until we hit an end pattern
-            if abstract_found:
-                if any(pattern in line_lower for pattern in abstract_end_patterns):
-                    break
-                if line.strip():  # Skip empty lines
-                    abstract_lines.append(line.strip())
+        Returns:
+            Optional[Dict[str, Any]]: Summary only, with the same keys whether or not the
+                                     cache was hit: 'metadata', 'page_word_counts',
+                                     'total_words', 'abstract' and 'extraction_success'
+                                     (no full text). None if extraction fails
+        """
+        pdf_path = Path(pdf_path)
+        cache_path = None
+        if pdf_path.exists():
+            cache_path = self._cache_path(pdf_path)
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                self.logger.info(f"Loaded cached extraction for {pdf_path.name}")
+                if not self.save_extracted_data(cached, output_path, "txt"):
+                    return None
+                return {
+                    'metadata': cached['metadata'],
+                    'page_word_counts': [page['word_count'] for page in cached['page_texts']],
+                    'total_words': cached['total_words'],
+                    'abstract': cached['abstract'] if 'abstract' in cached else self.extract_abstract(cached),
+                    'extraction_success': True
+                }
         
-        # Join abstract lines and limit to reasonable length
-        abstract = ' '.join(abstract_lines)
+        output_path = Path(output_path)
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                result = self.extract_and_write(str(pdf_path), f, cache_path)
+        except OSError as e:
+            self.logger.error(f"Error saving extracted data to {output_path}: {str(e)}")
+            return None
         
-        # If abstract is too long, it's probably not the abstract
-        if len(abstract) > 2000:
+        if result is None:
+            # Don't leave a partial file behind for a failed extraction
+            output_path.unlink(missing_ok=True)
             return None
+        
+        self.logger.info(f"Saved extracted data to {output_path} (TXT format)")
+        return result
+    
+    def extract_abstract(self, extracted_data: Dict[str, Any]) -> Optional[str]:
+        """
+        Attempt to extract the abstract from the extracted text.
+        
+        Args:
+            extracted_data (Dict[str, Any]): Data from extract_text_from_pdf
             
-        return abstract if abstract else None
+        Returns:
+            Optional[str]: Extracted abstract or None if not found
+        """
+        if not extracted_data or 'full_text' not in extracted_data:
+            return None
+        
+        scanner = _AbstractScanner(self._abstract_start_re, self._abstract_end_re)
+        # Read lines lazily; the scanner stops at the end of the abstract, which is
+        # normally on the first page, so the rest of the document is never split
+        scanner.feed_lines(io.StringIO(extracted_data['full_text'], newline='\n'))
+        return scanner.result()
+    
+    def _txt_header(self, metadata: Dict[str, Any]) -> str:
+        """Build the METADATA block and the FULL TEXT heading of a TXT export."""
+        rule = "=" * 50
+        parts = [rule, "\nMETADATA\n", rule, "\n\n"]
+        parts.extend(f"{key}: {value}\n" for key, value in metadata.items() if value)
+        parts.extend(["\n", rule, "\nFULL TEXT\n", rule, "\n\n"])
+        return "".join(parts)
+    
+    def _txt_abstract(self, abstract: str) -> str:
+        """Build the trailing ABSTRACT block of a TXT export."""
+        rule = "=" * 50
+        return f"\n{rule}\nABSTRACT\n{rule}\n\n{abstract}"
     
     def save_extracted_data(self, extracted_data: Dict[str, Any], output_path: str, format: str = "json") -> bool:
         """
@@ -165,36 +643,30 @@ class PDFTextExtractor:
             
             if format.lower() == "txt":
                 # Save as plain text file
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    # Write metadata header
-                    metadata = extracted_data.get('metadata', {})
-                    f.write("=" * 50 + "\n")
-                    f.write("METADATA\n")
-                    f.write("=" * 50 + "\n\n")
-                    
-                    for key, value in metadata.items():
-                        if value:
-                            f.write(f"{key}: {value}\n")
-                    
-                    f.write("\n" + "=" * 50 + "\n")
-                    f.write("FULL TEXT\n")
-                    f.write("=" * 50 + "\n\n")
-                    
-                    # Write full text
-                    full_text = extracted_data.get('full_text', '')
-                    f.write(full_text)
-                    
-                    # Write abstract if available
+                # Abstract if available (older cached results don't carry it)
+                if 'abstract' in extracted_data:
+                    abstract = extracted_data['abstract']
+                else:
                     abstract = self.extract_abstract(extracted_data)
-                    if abstract:
-                        f.write("\n" + "=" * 50 + "\n")
-                        f.write("ABSTRACT\n")
-                        f.write("=" * 50 + "\n\n")
-                        f.write(abstract)
+                
+                # Metadata header, full text and abstract in a single write
+                parts = [
+                    self._txt_header(extracted_data.get('metadata', {})),
+                    extracted_data.get('full_text', '')
+                ]
+                if abstract:
+                    parts.append(self._txt_abstract(abstract))
+                
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write("".join(parts))
             else:
                 # Save as JSON file (default)
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(extracted_data, f, indent=2, ensure_ascii=False)
+                if ORJSON_AVAILABLE:
+                    with open(output_path, 'wb') as f:
+                        f.write(orjson.dumps(extracted_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        json.dump(extracted_data, f, indent=2, ensure_ascii=False)
                 
             self.logger.info(f"Saved extracted data to {output_path} ({format.upper()} format)")
             return True
@@ -203,6 +675,97 @@ class PDFTextExtractor:
             self.logger.error(f"Error saving extracted data to {output_path}: {str(e)}")
             return False
     
+    def _extract_batch(self, jobs: List[Tuple[str, Optional[str]]], format: str) -> Dict[str, Any]:
+        """
+        Extract a batch of PDFs in parallel worker processes.
+        
+        PDF parsing is CPU-bound and independent per file, so each file goes to
+        its own process. Submission is bounded so only a few results per worker
+        are buffered at any time.
+        
+        Args:
+            jobs: (pdf_path, output_path) pairs; output_path None skips saving
+            format (str): Output format - "json" or "txt"
+            
+        Returns:
+            Dict[str, Any]: Results including successful and failed extractions, in input order
+        """
+        results = {'success': [], 'failed': [], 'total': len(jobs)}
+        if not jobs:
+            return results
+        
+        max_workers = _get_max_workers(len(jobs))
+        outcomes: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+        
+        if max_workers == 1:
+            self._extract_inline(jobs, format, outcomes)
+        else:
+            max_pending = max_workers * MAX_CONCURRENT_RESULTS_PER_WORKER
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                pending = {}
+                for index, (pdf_path, output_path) in enumerate(jobs):
+                    if len(pending) >= max_pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            outcomes[pending.pop(future)] = self._future_result(future)
+                    self.logger.info(f"Processing: {os.path.basename(pdf_path)}")
+                    future = executor.submit(_extract_one, pdf_path, output_path, format)
+                    pending[future] = index
+                for future in list(pending):
+                    outcomes[pending.pop(future)] = self._future_result(future)
+        
+        for (pdf_path, _), extracted_data in zip(jobs, outcomes):
+            if extracted_data:
+                results['success'].append({
+                    'file': os.path.basename(pdf_path),
+                    'data': extracted_data
+                })
+            else:
+                results['failed'].append(os.path.basename(pdf_path))
+        
+        return results
+    
+    def _extract_inline(self, jobs: List[Tuple[str, Optional[str]]], format: str,
+                        outcomes: List[Optional[Dict[str, Any]]]) -> None:
+        """
+        Extract a batch in this process, overlapping each save with the next extraction.
+        
+        Saves run on a single writer thread, so the disk write of one document
+        happens while the next one is being parsed. At most
+        MAX_CONCURRENT_RESULTS_PER_WORKER saves are queued at once.
+        
+        Args:
+            jobs: (pdf_path, output_path) pairs; output_path None skips saving
+            format (str): Output format - "json" or "txt"
+            outcomes: Filled in place with each job's extraction result
+        """
+        streamed = format.lower() == "txt"
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            saves = deque()
+            for index, (pdf_path, output_path) in enumerate(jobs):
+                self.logger.info(f"Processing: {os.path.basename(pdf_path)}")
+                if output_path and streamed:
+                    # TXT is written page by page during extraction, nothing to hand off
+                    outcomes[index] = self.extract_to_text_file(pdf_path, output_path)
+                    continue
+                
+                extracted_data = self.extract_text_from_pdf(pdf_path)
+                outcomes[index] = extracted_data
+                if extracted_data and output_path:
+                    if len(saves) >= MAX_CONCURRENT_RESULTS_PER_WORKER:
+                        saves.popleft().result()
+                    saves.append(writer.submit(self.save_extracted_data, extracted_data, output_path, format))
+            for save in saves:
+                save.result()
+    
+    def _future_result(self, future) -> Optional[Dict[str, Any]]:
+        """Return a worker's extraction result, logging worker crashes as failures."""
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.error(f"Extraction worker failed: {str(e)}")
+            return None
+    
     def process_downloaded_pdfs(self, downloaded_dir: str = "Downloaded_pdfs", 
                            output_dir: str = "data/extracted_texts", format: str = "txt") -> Dict[str, Any]:
         """
@@ -214,7 +777,12 @@ class PDFTextExtractor:
             format (str): Output format - "json" or "txt"
             
         Returns:
-            Dict[str, Any]: Results including successful and failed extractions
+            Dict[str, Any]: Results including successful and failed extractions.
+                For "json" each success entry's 'data' is the full extraction dict
+                (including 'full_text' and 'page_texts'); for "txt" it is only the
+                summary from extract_to_text_file (metadata, page_word_counts,
+                total_words, abstract, extraction_success) - read the text from
+                the written file instead.
         """
         downloaded_path = Path(downloaded_dir)
         
@@ -222,25 +790,14 @@ class PDFTextExtractor:
             self.logger.error(f"Downloaded directory not found: {downloaded_path}")
             return {'success': [], 'failed': [], 'total': 0}
         
-        pdf_files = list(downloaded_path.glob("*.pdf"))
-        results = {'success': [], 'failed': [], 'total': len(pdf_files)}
+        pdf_files = _list_pdfs(downloaded_path)
         
-        for pdf_file in pdf_files:
-            self.logger.info(f"Processing: {pdf_file.name}")
-            
-            extracted_data = self.extract_text_from_pdf(str(pdf_file))
-            
-            if extracted_data:
-                results['success'].append({
-                    'file': pdf_file.name,
-                    'data': extracted_data
-                })
-                
-                # Save to output directory
-                output_path = Path(output_dir) / f"{pdf_file.stem}_extracted.{format}"
-                self.save_extracted_data(extracted_data, str(output_path), format)
-            else:
-                results['failed'].append(pdf_file.name)
+        # Save each extraction to the output directory
+        jobs = [
+            (pdf_file, os.path.join(output_dir, f"{_stem(pdf_file)}_extracted.{format}"))
+            for pdf_file in pdf_files
+        ]
+        results = self._extract_batch(jobs, format)
         
         self.logger.info(f"Processing complete: {len(results['success'])} successful, {len(results['failed'])} failed")
         return results
@@ -262,26 +819,14 @@ class PDFTextExtractor:
             self.logger.error(f"Directory not found: {directory_path}")
             return {'success': [], 'failed': [], 'total': 0}
         
-        pdf_files = list(directory_path.glob('*.pdf'))
-        results = {'success': [], 'failed': [], 'total': len(pdf_files)}
+        pdf_files = _list_pdfs(directory_path)
         
-        for pdf_file in pdf_files:
-            self.logger.info(f"Processing: {pdf_file.name}")
-            
-            extracted_data = self.extract_text_from_pdf(str(pdf_file))
-            
-            if extracted_data:
-                results['success'].append({
-                    'file': pdf_file.name,
-                    'data': extracted_data
-                })
-                
-                # Save to output directory if specified
-                if output_dir:
-                    output_path = Path(output_dir) / f"{pdf_file.stem}_extracted.json"
-                    self.save_extracted_data(extracted_data, str(output_path))
-            else:
-                results['failed'].append(pdf_file.name)
+        # Save to output directory if specified
+        jobs = [
+            (pdf_file, os.path.join(output_dir, f"{_stem(pdf_file)}_extracted.json") if output_dir else None)
+            for pdf_file in pdf_files
+        ]
+        results = self._extract_batch(jobs, "json")
         
         self.logger.info(f"Batch extraction complete: {len(results['success'])} successful, {len(results['failed'])} failed")
         return results
@@ -313,7 +858,9 @@ def process_downloaded_pdfs(downloaded_dir: str = "Downloaded_pdfs",
         format (str): Output format - "json" or "txt"
         
     Returns:
-        Dict[str, Any]: Results including successful and failed extractions
+        Dict[str, Any]: Results including successful and failed extractions.
+            With "txt" each success entry's 'data' is a summary without
+            'full_text' or 'page_texts'; see PDFTextExtractor.process_downloaded_pdfs.
     """
     extractor = PDFTextExtractor()
     return extractor.process_downloaded_pdfs(downloaded_dir, output_dir, format)
@@ -18,6 +18,10 @@ class DraftPDFGenerator:
     def __init__(self):
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
+        
+        # Text cleanup helpers, built once per generator
+        self._ws_re = re.compile(r'\s+')
+        self._escape_table = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
     
     def _setup_custom_styles(self):
         """Setup custom paragraph styles"""
@@ -77,13 +81,8 @@ class DraftPDFGenerator:
     
     def _clean_text(self, text):
         """Clean text for PDF rendering"""
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Escape special characters
-        text = text.replace('&', '&amp;')
-        text = text.replace('<', '&lt;')
-        text = text.replace('>', '&gt;')
-        return text.strip()
+        # Collapse excessive whitespace, then escape special characters in one pass
+        return self._ws_re.sub(' ', text).translate(self._escape_table).strip()
     
     def _parse_draft_sections(self, draft_text):
         """Parse draft text into sections"""
@@ -98,8 +97,9 @@ class DraftPDFGenerator:
             if not line:
                 continue
             
-            # Check for section headers (lines with ## or all caps)
-            if line.startswith('##') or (line.isupper() and len(line) > 3):
+            # Check for section headers (lines with ## or all caps); the length
+            # test is cheapest, so it runs before the full isupper() scan
+            if line.startswith('##') or (len(line) > 3 and line.isupper()):
                 # Save previous section
                 if current_section:
                     sections.append({
@@ -124,6 +124,11 @@ class DraftPDFGenerator:
     
     def generate_comprehensive_pdf(self, draft_text, output_path, title="Research Draft", metadata=None):
         """Generate comprehensive PDF from draft text"""
+        sections = self._parse_draft_sections(draft_text)
+        return self._build_comprehensive_pdf(sections, output_path, title, metadata)
+    
+    def _build_comprehensive_pdf(self, sections, output_path, title, metadata=None):
+        """Build the comprehensive PDF layout from an iterable of parsed sections"""
         doc = SimpleDocTemplate(
             output_path,
             pagesize=letter,
@@ -147,9 +152,7 @@ class DraftPDFGenerator:
             story.append(Paragraph(meta_text, self.styles['Normal']))
             story.append(Spacer(1, 0.5*inch))
         
-        # Parse and add sections
-        sections = self._parse_draft_sections(draft_text)
-        
+        # Add sections
         for section in sections:
             # Add section title
             story.append(Paragraph(self._clean_text(section['title']), self.styles['SectionHeading']))
@@ -178,6 +181,13 @@ class DraftPDFGenerator:
         
         story = []
         
+        # Bind styles and helpers used in the per-topic loop to locals
+        append = story.append
+        clean = self._clean_text
+        section_hdr = self.styles['SectionHeading']
+        sub_hdr = self.styles['SubsectionHeading']
+        body = self.styles['CustomBody']
+        
         # Add title
         story.append(Paragraph(self._clean_text(title), self.styles['CustomTitle']))
         story.append(Spacer(1, 0.3*inch))
@@ -188,33 +198,34 @@ class DraftPDFGenerator:
         story.append(Spacer(1, 0.5*inch))
         
         # Add table of contents
-        story.append(Paragraph("Table of Contents", self.styles['SectionHeading']))
+        append(Paragraph("Table of Contents", section_hdr))
+        normal = self.styles['Normal']
         for i, topic in enumerate(topics_dict.keys(), 1):
-            story.append(Paragraph(f"{i}. {self._clean_text(topic)}", self.styles['Normal']))
-        story.append(PageBreak())
+            append(Paragraph(f"{i}. {clean(topic)}", normal))
+        append(PageBreak())
         
         # Add each topic section
         for topic, content in topics_dict.items():
             # Topic title
-            story.append(Paragraph(self._clean_text(topic), self.styles['SectionHeading']))
-            story.append(Spacer(1, 0.2*inch))
+            append(Paragraph(clean(topic), section_hdr))
+            append(Spacer(1, 0.2*inch))
             
             # Parse subsections if any
             if isinstance(content, dict):
                 for subtopic, subcontent in content.items():
-                    story.append(Paragraph(self._clean_text(subtopic), self.styles['SubsectionHeading']))
-                    story.append(Paragraph(self._clean_text(str(subcontent)), self.styles['CustomBody']))
-                    story.append(Spacer(1, 0.15*inch))
+                    append(Paragraph(clean(subtopic), sub_hdr))
+                    append(Paragraph(clean(str(subcontent)), body))
+                    append(Spacer(1, 0.15*inch))
             else:
                 # Add content paragraphs
                 paragraphs = str(content).split('\n\n')
                 for para in paragraphs:
                     if para.strip():
-                        story.append(Paragraph(self._clean_text(para), self.styles['CustomBody']))
-                        story.append(Spacer(1, 0.1*inch))
+                        append(Paragraph(clean(para), body))
+                        append(Spacer(1, 0.1*inch))
             
             # Page break between topics
-            story.append(PageBreak())
+            append(PageBreak())
         
         # Build PDF
         doc.build(story)
@@ -223,14 +234,18 @@ class DraftPDFGenerator:
     def generate_from_papers(self, papers_data, output_path, draft_type="comprehensive"):
         """Generate PDF from papers data structure"""
         if draft_type == "comprehensive":
-            # Combine all paper content
-            combined_text = ""
-            for paper in papers_data:
-                combined_text += f"\n\n## {paper.get('title', 'Untitled')}\n\n"
-                combined_text += paper.get('content', paper.get('abstract', ''))
+            # Parse each paper on its own rather than concatenating every paper
+            # into one draft string first, which is quadratic in the total size
+            sections = (
+                section
+                for paper in papers_data
+                for section in self._parse_draft_sections(
+                    f"## {paper.get('title', 'Untitled')}\n\n{paper.get('content', paper.get('abstract', ''))}"
+                )
+            )
             
-            return self.generate_comprehensive_pdf(
-                combined_text,
+            return self._build_comprehensive_pdf(
+                sections,
                 output_path,
                 title="Comprehensive Research Analysis",
                 metadata={'papers_count': len(papers_data)}
@@ -250,6 +265,19 @@ class DraftPDFGenerator:
                 title="Topic-Wise Research Analysis"
             )
 
+# Shared generator for the convenience functions, created on first use so the
+# style sheet is only built once per process
+_DEFAULT_GENERATOR = None
+
+
+def _get_default_generator():
+    """Return the shared DraftPDFGenerator, creating it on first use"""
+    global _DEFAULT_GENERATOR
+    if _DEFAULT_GENERATOR is None:
+        _DEFAULT_GENERATOR = DraftPDFGenerator()
+    return _DEFAULT_GENERATOR
+
+
 # Convenience functions
 def generate_pdf(draft_text, output_path, pdf_type="comprehensive", **kwargs):
     """
@@ -261,7 +289,7 @@ def generate_pdf(draft_text, output_path, pdf_type="comprehensive", **kwargs):
         pdf_type: 'comprehensive' or 'topic_wise'
         **kwargs: Additional metadata
     """
-    generator = DraftPDFGenerator()
+    generator = _get_default_generator()
     
     if pdf_type == "comprehensive":
         return generator.generate_comprehensive_pdf(draft_text, output_path, **kwargs)
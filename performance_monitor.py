@@ -15,28 +15,202 @@ Features:
 """
 
 import time
-import psutil
 import threading
+import weakref
 import json
 import logging
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
-from pathlib import Path
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from collections import deque
 import functools
+import heapq
+import itertools
+import math
+import operator
+import os
 import sys
+from array import array
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Background sampling interval and the number of metric samples kept in memory:
+# 24 hours of samples at that interval, for up to 12 metric names per sample
+MONITOR_INTERVAL_SECONDS = 10
+MAX_METRICS = int(24 * 3600 / MONITOR_INTERVAL_SECONDS) * 12
+
+# Samples kept per metric name for time-series queries (24h at the monitor interval)
+MAX_SERIES_LENGTH = int(24 * 3600 / MONITOR_INTERVAL_SECONDS)
+
+# Number of slowest operations kept for bottleneck detection
+SLOW_OPERATIONS_TRACKED = 50
+
+# Most recent operations kept in full; older ones survive only in the aggregates
+MAX_PROCESSING_STATS = 10_000
+
+# Set PERF_MON=0 to make @monitor_performance call straight through to the function
+MONITOR_ENABLED = os.environ.get('PERF_MON', '1') == '1'
+
+# Page size for the page counts in /proc/self/statm
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _read_proc(path: str) -> bytes:
+    """Read a whole /proc file with raw os.read calls (procfs reports size 0, so read to EOF)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 16384)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def _proc_fields_kb(data: bytes, keys: tuple) -> Dict[bytes, int]:
+    """Parse 'Key:  123 kB' lines of /proc/meminfo into bytes."""
+    values = {}
+    for line in data.splitlines():
+        key, _, rest = line.partition(b':')
+        if key in keys:
+            values[key] = int(rest.split()[0]) * 1024
+    return values
+
+
+@dataclass(slots=True, frozen=True)
 class PerformanceMetric:
     """Single performance metric data point."""
     name: str
     value: float
     unit: str
     timestamp: float
-    context: Dict[str, Any] = None
+    context: Optional[Mapping[str, Any]] = None
+
+class MetricBuffer:
+    """
+    Fixed-capacity ring buffer of metric samples stored column-wise.
+    
+    Timestamps, values and interned name ids live in three typed arrays, so a
+    sample costs a few bytes in preallocated storage instead of a Python object.
+    Units are kept per name and contexts only for the rare samples that have one.
+    PerformanceMetric objects are built only when samples are read back.
+    Each name also keeps its own (timestamp, value) series so that queries on
+    one metric do not scan the samples of all the others.
+    """
+    
+    def __init__(self, capacity: int, series_length: int = MAX_SERIES_LENGTH):
+        self.capacity = capacity
+        self._ts = array('d', bytes(8 * capacity))
+        self._val = array('d', bytes(8 * capacity))
+        self._nid = array('i', bytes(4 * capacity))
+        self._names: List[str] = []
+        self._units: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self._series: List[deque] = []  # Name id -> deque of (timestamp, value)
+        self._series_length = series_length
+        self._contexts: Dict[int, Mapping[str, Any]] = {}  # Slot -> non-empty context
+        self._head = 0  # Next slot to write
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, name: str, value: float, unit: str, timestamp: float,
+               context: Optional[Mapping[str, Any]] = None):
+        """Record a sample, overwriting the oldest one when the buffer is full."""
+        with self._lock:
+            name_id = self._name_ids.get(name)
+            if name_id is None:
+                name_id = self._name_ids[name] = len(self._names)
+                self._names.append(name)
+                self._units.append(unit)
+                self._series.append(deque(maxlen=self._series_length))
+            
+            self._series[name_id].append((timestamp, value))
+            slot = self._head
+            self._ts[slot] = timestamp
+            self._val[slot] = value
+            self._nid[slot] = name_id
+            if context:
+                self._contexts[slot] = context
+            elif self._contexts:
+                self._contexts.pop(slot, None)
+            
+            self._head = (slot + 1) % self.capacity
+            if self._size < self.capacity:
+                self._size += 1
+    
+    def _slots(self, count: Optional[int] = None) -> List[int]:
+        """Slots of the newest `count` samples (all by default), oldest first. Caller holds the lock."""
+        count = self._size if count is None else min(count, self._size)
+        start = (self._head - count) % self.capacity
+        return [(start + i) % self.capacity for i in range(count)]
+    
+    def _metric(self, slot: int) -> PerformanceMetric:
+        name_id = self._nid[slot]
+        return PerformanceMetric(
+            name=self._names[name_id],
+            value=self._val[slot],
+            unit=self._units[name_id],
+            timestamp=self._ts[slot],
+            context=self._contexts.get(slot)
+        )
+    
+    def recent(self, count: Optional[int] = None) -> List[PerformanceMetric]:
+        """The newest `count` samples (all by default), oldest first."""
+        with self._lock:
+            return [self._metric(slot) for slot in self._slots(count)]
+    
+    def recent_records(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """The newest `count` samples as plain dicts (same keys as asdict(PerformanceMetric))."""
+        with self._lock:
+            ts, val, nid, names, units = self._ts, self._val, self._nid, self._names, self._units
+            return [
+                {
+                    'name': names[nid[slot]],
+                    'value': val[slot],
+                    'unit': units[nid[slot]],
+                    'timestamp': ts[slot],
+                    'context': self._contexts.get(slot)
+                }
+                for slot in self._slots(count)
+            ]
+    
+    def values_since(self, name: str, cutoff: float) -> List[float]:
+        """Values of one metric with a timestamp after cutoff, oldest first."""
+        with self._lock:
+            name_id = self._name_ids.get(name)
+            if name_id is None:
+                return []
+            values = []
+            for timestamp, value in reversed(self._series[name_id]):
+                if timestamp <= cutoff:
+                    break
+                values.append(value)
+        values.reverse()
+        return values
+    
+    def drop_older_than(self, cutoff: float):
+        """Forget samples with a timestamp at or before cutoff."""
+        with self._lock:
+            while self._size:
+                oldest = (self._head - self._size) % self.capacity
+                if self._ts[oldest] > cutoff:
+                    break
+                self._contexts.pop(oldest, None)
+                self._size -= 1
+            for series in self._series:
+                while series and series[0][0] <= cutoff:
+                    series.popleft()
 
-@dataclass
+
+@dataclass(slots=True)
 class ProcessingStats:
     """Statistics for a processing operation."""
     operation_name: str
@@ -58,11 +232,34 @@ class PerformanceMonitor:
     def __init__(self, metrics_file: str = "performance_metrics.json"):
         """Initialize the performance monitor."""
         self.metrics_file = metrics_file
-        self.metrics: List[PerformanceMetric] = []
-        self.processing_stats: List[ProcessingStats] = []
-        self.active_operations: Dict[str, float] = {}
+        self.metrics = MetricBuffer(MAX_METRICS)
+        self.latest: Dict[str, Tuple[float, float]] = {}  # Name -> (timestamp, value) of the newest sample
+        self.processing_stats: deque = deque(maxlen=MAX_PROCESSING_STATS)
+        self._stats_lock = threading.Lock()
+        self._reset_operation_aggregates()
+        self._op_counter = itertools.count(1)
+        
+        # Active operations are recorded in a per-thread table (id -> (name, monotonic
+        # start)), so monitored calls never share a dict or a lock with each other.
+        # The registry pairs each table with a weak reference to its thread, so that
+        # tables of exited threads can be dropped once their operations have ended.
+        self._tls = threading.local()
+        self._thread_tables: List[Tuple[weakref.ref, Dict[int, Tuple[str, float, Optional[float]]]]] = []
+        self._tables_lock = threading.Lock()
         self.monitoring_active = False
         self.monitoring_thread = None
+        self._stop_evt = threading.Event()  # Set to wake and stop the monitor thread
+        # psutil is imported here rather than at module level, so that importing this
+        # module with PERF_MON=0 (no monitor is created) doesn't load it
+        import psutil
+        self._proc = psutil.Process()  # Reused so CPU percentages are measured between samples
+        self._ncpu = psutil.cpu_count() or 1
+        self._disk_total = psutil.disk_usage('.').total  # Fixed for the filesystem's lifetime
+        
+        # On Linux, system metrics are read straight from /proc; psutil is the fallback
+        self._linux = sys.platform.startswith('linux')
+        self._prev_cpu_ticks = None  # (busy, total) from /proc/stat
+        self._prev_proc_cpu = None  # (process CPU seconds, monotonic time)
         
         # Performance thresholds
         self.thresholds = {
@@ -73,6 +270,13 @@ class PerformanceMonitor:
             'cpu_warning': 80,  # 80%
             'cpu_critical': 95  # 95%
         }
+        # Read once here rather than looked up on every sample
+        self._th_mem_warn = self.thresholds['memory_warning']
+        self._th_mem_crit = self.thresholds['memory_critical']
+        self._th_time_warn = self.thresholds['processing_time_warning']
+        self._th_time_crit = self.thresholds['processing_time_critical']
+        self._th_cpu_warn = self.thresholds['cpu_warning']
+        self._th_cpu_crit = self.thresholds['cpu_critical']
         
         # Setup logging
         self.logger = logging.getLogger('performance_monitor')
@@ -102,7 +306,12 @@ class PerformanceMonitor:
         if self.monitoring_active:
             return
         
+        # Prime the non-blocking CPU counters; the first real sample then
+        # reports usage since this call rather than 0.0
+        self._sample_system()
+        
         self.monitoring_active = True
+        self._stop_evt.clear()
         self.monitoring_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitoring_thread.start()
         self.logger.info("Performance monitoring started")
@@ -110,120 +319,252 @@ class PerformanceMonitor:
     def stop_monitoring(self):
         """Stop background performance monitoring."""
         self.monitoring_active = False
+        self._stop_evt.set()
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=5)
         self.logger.info("Performance monitoring stopped")
     
     def _monitor_loop(self):
         """Background monitoring loop."""
-        while self.monitoring_active:
+        while not self._stop_evt.is_set():
             try:
-                # Collect system metrics
-                self._collect_system_metrics()
+                # Collect system metrics, all stamped with one wall-clock time
+                self._collect_system_metrics(time.time())
                 
                 # Check for performance issues
                 self._check_performance_thresholds()
                 
-                # Sleep for monitoring interval
-                time.sleep(10)  # Monitor every 10 seconds
+                # Sleep for monitoring interval; stop_monitoring wakes us early
+                if self._stop_evt.wait(MONITOR_INTERVAL_SECONDS):
+                    break
                 
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(30)  # Wait longer on error
+                if self._stop_evt.wait(30):  # Wait longer on error
+                    break
     
-    def _collect_system_metrics(self):
-        """Collect system performance metrics."""
-        current_time = time.time()
+    def _collect_system_metrics(self, current_time: Optional[float] = None):
+        """Collect system performance metrics, timestamped with current_time (default: now)."""
+        if current_time is None:
+            current_time = time.time()
+        sample = self._sample_system()
         
         # Memory metrics
-        memory = psutil.virtual_memory()
-        self.add_metric("memory_used", memory.used, "bytes", current_time)
-        self.add_metric("memory_percent", memory.percent, "percent", current_time)
-        self.add_metric("memory_available", memory.available, "bytes", current_time)
+        self.add_metric("memory_used", sample['memory_used'], "bytes", current_time)
+        self.add_metric("memory_percent", sample['memory_percent'], "percent", current_time)
+        self.add_metric("memory_available", sample['memory_available'], "bytes", current_time)
         
-        # CPU metrics
-        cpu_percent = psutil.cpu_percent(interval=1)
-        self.add_metric("cpu_percent", cpu_percent, "percent", current_time)
+        # CPU metrics (non-blocking: usage since the previous sample)
+        self.add_metric("cpu_percent", sample['cpu_percent'], "percent", current_time)
         
         # Process-specific metrics
-        process = psutil.Process()
-        process_memory = process.memory_info()
-        self.add_metric("process_memory_rss", process_memory.rss, "bytes", current_time)
-        self.add_metric("process_memory_vms", process_memory.vms, "bytes", current_time)
-        self.add_metric("process_cpu_percent", process.cpu_percent(), "percent", current_time)
+        self.add_metric("process_memory_rss", sample['process_memory_rss'], "bytes", current_time)
+        self.add_metric("process_memory_vms", sample['process_memory_vms'], "bytes", current_time)
+        self.add_metric("process_cpu_percent", sample['process_cpu_percent'], "percent", current_time)
         
         # Disk metrics
-        disk = psutil.disk_usage('.')
-        self.add_metric("disk_used", disk.used, "bytes", current_time)
-        self.add_metric("disk_percent", (disk.used / disk.total) * 100, "percent", current_time)
+        self.add_metric("disk_used", sample['disk_used'], "bytes", current_time)
+        self.add_metric("disk_percent", (sample['disk_used'] / self._disk_total) * 100, "percent", current_time)
+    
+    def _sample_system(self) -> Dict[str, float]:
+        """Read one sample of all system metrics, from /proc on Linux or psutil elsewhere."""
+        if self._linux:
+            try:
+                return self._sample_linux()
+            except (OSError, KeyError, ValueError, IndexError) as e:
+                self.logger.warning(f"Reading /proc failed, falling back to psutil: {e}")
+                self._linux = False
+        return self._sample_psutil()
+    
+    def _sample_linux(self) -> Dict[str, float]:
+        """
+        Sample system metrics with one read each of /proc/meminfo, /proc/stat and
+        the one-line /proc/self/statm, an os.times() call for process CPU time and a
+        single statvfs call for used disk space (the disk total is cached at startup).
+        
+        Values match psutil's definitions: used memory is total minus available,
+        and CPU percentages are deltas since the previous reading.
+        """
+        mem = _proc_fields_kb(_read_proc('/proc/meminfo'), (b'MemTotal', b'MemAvailable'))
+        mem_total = mem[b'MemTotal']
+        mem_available = mem[b'MemAvailable']
+        
+        # Aggregate 'cpu' line: user nice system idle iowait irq softirq steal (guest is
+        # already counted in user/nice)
+        ticks = [int(v) for v in _read_proc('/proc/stat').split(b'\n', 1)[0].split()[1:9]]
+        total_ticks = sum(ticks)
+        busy_ticks = total_ticks - ticks[3] - ticks[4]
+        cpu_percent = 0.0
+        if self._prev_cpu_ticks is not None:
+            busy_delta = busy_ticks - self._prev_cpu_ticks[0]
+            total_delta = total_ticks - self._prev_cpu_ticks[1]
+            if total_delta > 0:
+                cpu_percent = round(100.0 * busy_delta / total_delta, 1)
+        self._prev_cpu_ticks = (busy_ticks, total_ticks)
+        
+        now = time.monotonic()
+        
+        # statm: total program size and resident set size, in pages
+        statm = _read_proc('/proc/self/statm').split()
+        
+        proc_seconds = self._process_cpu_time()
+        process_cpu_percent = 0.0
+        if self._prev_proc_cpu is not None:
+            wall_delta = now - self._prev_proc_cpu[1]
+            if wall_delta > 0:
+                process_cpu_percent = round(100.0 * (proc_seconds - self._prev_proc_cpu[0]) / wall_delta, 1)
+        self._prev_proc_cpu = (proc_seconds, now)
+        
+        disk = os.statvfs('.')
+        
+        return {
+            'memory_used': mem_total - mem_available,
+            'memory_percent': round(100.0 * (mem_total - mem_available) / mem_total, 1),
+            'memory_available': mem_available,
+            'cpu_percent': cpu_percent,
+            'process_memory_rss': int(statm[1]) * _PAGE_SIZE,
+            'process_memory_vms': int(statm[0]) * _PAGE_SIZE,
+            'process_cpu_percent': process_cpu_percent,
+            'disk_used': (disk.f_blocks - disk.f_bfree) * disk.f_frsize
+        }
+    
+    def _sample_psutil(self) -> Dict[str, float]:
+        """Sample system metrics through psutil (non-Linux platforms)."""
+        import psutil
+        memory = psutil.virtual_memory()
+        process_memory = self._proc.memory_info()
+        return {
+            'memory_used': memory.used,
+            'memory_percent': memory.percent,
+            'memory_available': memory.available,
+            'cpu_percent': psutil.cpu_percent(interval=None),
+            'process_memory_rss': process_memory.rss,
+            'process_memory_vms': process_memory.vms,
+            'process_cpu_percent': self._proc.cpu_percent(interval=None),
+            'disk_used': psutil.disk_usage('.').used
+        }
     
     def _check_performance_thresholds(self):
         """Check performance thresholds and log warnings."""
         current_metrics = self.get_latest_metrics()
         
-        # Check memory usage
-        memory_percent = current_metrics.get("memory_percent", 0)
-        if memory_percent > self.thresholds['cpu_critical']:
-            self.logger.critical(f"Critical memory usage: {memory_percent:.1f}%")
-        elif memory_percent > self.thresholds['cpu_warning']:
-            self.logger.warning(f"High memory usage: {memory_percent:.1f}%")
+        # Check memory usage (the memory thresholds are process RSS in bytes)
+        process_memory = current_metrics.get("process_memory_rss", 0)
+        if process_memory > self._th_mem_crit:
+            self.logger.critical("Critical memory usage: %.1f MB", process_memory / (1024 * 1024))
+        elif process_memory > self._th_mem_warn:
+            self.logger.warning("High memory usage: %.1f MB", process_memory / (1024 * 1024))
         
         # Check CPU usage
         cpu_percent = current_metrics.get("cpu_percent", 0)
-        if cpu_percent > self.thresholds['cpu_critical']:
-            self.logger.critical(f"Critical CPU usage: {cpu_percent:.1f}%")
-        elif cpu_percent > self.thresholds['cpu_warning']:
-            self.logger.warning(f"High CPU usage: {cpu_percent:.1f}%")
-        
-        # Check long-running operations
-        current_time = time.time()
-        for operation, start_time in self.active_operations.items():
+        if cpu_percent > self._th_cpu_crit:
+            self.logger.critical("Critical CPU usage: %.1f%%", cpu_percent)
+        elif cpu_percent > self._th_cpu_warn:
+            self.logger.warning("High CPU usage: %.1f%%", cpu_percent)
+        
+        # Check long-running operations (start times are monotonic); skip the
+        # walk entirely when no warning would be emitted
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        current_time = time.monotonic()
+        for operation, start_time, _ in self.active_operations.values():
             duration = current_time - start_time
-            if duration > self.thresholds['processing_time_critical']:
-                self.logger.critical(f"Operation '{operation}' running for {duration:.1f}s (critical)")
-            elif duration > self.thresholds['processing_time_warning']:
-                self.logger.warning(f"Operation '{operation}' running for {duration:.1f}s (warning)")
+            if duration > self._th_time_crit:
+                self.logger.critical("Operation '%s' running for %.1fs (critical)", operation, duration)
+            elif duration > self._th_time_warn:
+                self.logger.warning("Operation '%s' running for %.1fs (warning)", operation, duration)
     
     def add_metric(self, name: str, value: float, unit: str, timestamp: Optional[float] = None, 
-                   context: Dict[str, Any] = None):
+                   context: Optional[Mapping[str, Any]] = None):
         """Add a performance metric."""
         if timestamp is None:
             timestamp = time.time()
         
-        metric = PerformanceMetric(
-            name=name,
-            value=value,
-            unit=unit,
-            timestamp=timestamp,
-            context=context or {}
-        )
-        
-        self.metrics.append(metric)
-        
-        # Keep only recent metrics (last 24 hours)
-        cutoff_time = time.time() - (24 * 60 * 60)
-        self.metrics = [m for m in self.metrics if m.timestamp > cutoff_time]
+        # Bounded to roughly the last 24 hours; the oldest sample is overwritten
+        self.metrics.append(name, value, unit, timestamp, context)
+        self.latest[name] = (timestamp, value)
+    
+    def _local_operations(self) -> Dict[int, Tuple[str, float, Optional[float]]]:
+        """The calling thread's operation table, registered on first use."""
+        table = getattr(self._tls, 'active', None)
+        if table is None:
+            table = self._tls.active = {}
+            with self._tables_lock:
+                # Forget tables of exited threads that have nothing left in progress
+                self._thread_tables = [
+                    (thread_ref, other) for thread_ref, other in self._thread_tables
+                    if other or thread_ref() is not None
+                ]
+                self._thread_tables.append((weakref.ref(threading.current_thread()), table))
+        return table
     
-    def start_operation(self, operation_name: str) -> str:
-        """Start monitoring an operation."""
-        operation_id = f"{operation_name}_{int(time.time() * 1000)}"
-        self.active_operations[operation_id] = time.time()
+    @property
+    def active_operations(self) -> Dict[int, Tuple[str, float, Optional[float]]]:
+        """Snapshot of the operations in progress on all threads."""
+        operations = {}
+        for _, table in list(self._thread_tables):
+            # dict.copy() is a single C call, so it can't see a half-applied update
+            operations.update(table.copy())
+        return operations
+    
+    def start_operation(self, operation_name: str, detailed: bool = False) -> int:
+        """
+        Start monitoring an operation and return its id for end_operation.
+        
+        Pass detailed=True to snapshot the process CPU time, so that
+        end_operation(..., detailed=True) can report CPU usage over the operation.
+        """
+        operation_id = next(self._op_counter)
+        cpu_start = self._process_cpu_time() if detailed else None
+        # Monotonic, so durations can't go negative if the wall clock is stepped
+        self._local_operations()[operation_id] = (operation_name, time.monotonic(), cpu_start)
         return operation_id
     
-    def end_operation(self, operation_id: str, operation_name: str, success: bool = True,
+    @staticmethod
+    def _process_cpu_time() -> float:
+        """User plus system CPU seconds used by this process so far."""
+        times = os.times()
+        return times.user + times.system
+    
+    def end_operation(self, operation_id: Union[int, str], operation_name: str, success: bool = True,
                       error_message: Optional[str] = None, input_size: Optional[int] = None,
-                      output_size: Optional[int] = None) -> ProcessingStats:
-        """End monitoring an operation and record statistics."""
-        if operation_id not in self.active_operations:
+                      output_size: Optional[int] = None, detailed: bool = False) -> ProcessingStats:
+        """
+        End monitoring an operation and record statistics.
+        
+        Only the duration is measured by default; pass detailed=True to also
+        sample the process's memory and CPU usage (memory and CPU fields are 0 otherwise).
+        CPU usage is only known if the operation was started with detailed=True too.
+        """
+        if isinstance(operation_id, str) and operation_id.isdigit():
+            operation_id = int(operation_id)  # Accept ids that were stringified by the caller
+        record = self._local_operations().pop(operation_id, None)
+        if record is None:
+            # Ended on a different thread than it started on
+            for _, table in list(self._thread_tables):
+                record = table.pop(operation_id, None)
+                if record is not None:
+                    break
+        if record is None:
             raise ValueError(f"Operation {operation_id} not found")
         
-        start_time = self.active_operations.pop(operation_id)
+        duration = time.monotonic() - record[1]
+        # Wall-clock times for the report, derived from the monotonic duration
         end_time = time.time()
-        duration = end_time - start_time
+        start_time = end_time - duration
         
         # Get memory metrics
-        process = psutil.Process()
-        memory_info = process.memory_info()
+        if detailed:
+            memory_rss = self._proc.memory_info().rss
+            cpu_start = record[2]
+            if cpu_start is not None:
+                # Share of all cores used by the process while the operation ran
+                cpu_used = self._process_cpu_time() - cpu_start
+                cpu_percent = 100.0 * cpu_used / max(duration, 1e-9) / self._ncpu
+            else:
+                cpu_percent = 0
+        else:
+            memory_rss = cpu_percent = 0
         
         stats = ProcessingStats(
             operation_name=operation_name,
@@ -231,57 +572,80 @@ class PerformanceMonitor:
             end_time=end_time,
             duration=duration,
             memory_before=0,  # Would need to track this separately
-            memory_after=memory_info.rss,
-            memory_peak=memory_info.rss,  # Simplified
-            cpu_percent=process.cpu_percent(),
+            memory_after=memory_rss,
+            memory_peak=memory_rss,  # Simplified
+            cpu_percent=cpu_percent,
             success=success,
             error_message=error_message,
             input_size=input_size,
             output_size=output_size
         )
         
-        self.processing_stats.append(stats)
+        with self._stats_lock:
+            self.processing_stats.append(stats)
+            self._add_to_aggregates(stats)
         
         # Log operation completion
         if success:
-            self.logger.info(f"Operation '{operation_name}' completed in {duration:.2f}s")
+            self.logger.info("Operation '%s' completed in %.2fs", operation_name, duration)
         else:
-            self.logger.error(f"Operation '{operation_name}' failed after {duration:.2f}s: {error_message}")
+            self.logger.error("Operation '%s' failed after %.2fs: %s", operation_name, duration, error_message)
         
         return stats
     
     def get_latest_metrics(self, count: int = 100) -> Dict[str, float]:
-        """Get the latest metrics."""
-        latest_metrics = {}
-        recent_metrics = sorted(self.metrics, key=lambda m: m.timestamp, reverse=True)[:count]
-        
-        for metric in recent_metrics:
-            if metric.name not in latest_metrics:
-                latest_metrics[metric.name] = metric.value
-        
-        return latest_metrics
+        """Get the latest value of each metric (count is unused, kept for compatibility)."""
+        return {name: value for name, (_, value) in list(self.latest.items())}
+    
+    def _reset_operation_aggregates(self, stats: Optional[List[ProcessingStats]] = None):
+        """Rebuild the running operation aggregates from stats (empty by default)."""
+        self._op_count = 0
+        self._op_success_count = 0
+        self._dur_sum = 0.0
+        self._dur_min = math.inf
+        self._dur_max = 0.0
+        self._slowest: List[Tuple[float, int, ProcessingStats]] = []  # Min-heap of the slowest ops
+        self._slow_seq = itertools.count()  # Tie-breaker so stats are never compared
+        for stat in stats or []:
+            self._add_to_aggregates(stat)
+    
+    def _add_to_aggregates(self, stats: ProcessingStats):
+        """Fold one finished operation into the running aggregates. Caller holds _stats_lock."""
+        duration = stats.duration
+        self._op_count += 1
+        if stats.success:
+            self._op_success_count += 1
+        self._dur_sum += duration
+        self._dur_min = min(self._dur_min, duration)
+        self._dur_max = max(self._dur_max, duration)
+        
+        entry = (duration, next(self._slow_seq), stats)
+        if len(self._slowest) < SLOW_OPERATIONS_TRACKED:
+            heapq.heappush(self._slowest, entry)
+        else:
+            heapq.heappushpop(self._slowest, entry)
     
     def get_operation_stats(self, operation_name: Optional[str] = None) -> List[ProcessingStats]:
         """Get processing statistics."""
         if operation_name:
             return [s for s in self.processing_stats if s.operation_name == operation_name]
-        return self.processing_stats.copy()
+        return list(self.processing_stats)
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get comprehensive performance summary."""
         # System metrics
         current_metrics = self.get_latest_metrics()
         
-        # Operation statistics
-        total_operations = len(self.processing_stats)
-        successful_operations = len([s for s in self.processing_stats if s.success])
+        # Operation statistics (maintained incrementally by end_operation)
+        total_operations = self._op_count
+        successful_operations = self._op_success_count
         failed_operations = total_operations - successful_operations
         
         # Performance calculations
-        if self.processing_stats:
-            avg_duration = sum(s.duration for s in self.processing_stats) / len(self.processing_stats)
-            max_duration = max(s.duration for s in self.processing_stats)
-            min_duration = min(s.duration for s in self.processing_stats)
+        if total_operations:
+            avg_duration = self._dur_sum / total_operations
+            max_duration = self._dur_max
+            min_duration = self._dur_min
         else:
             avg_duration = max_duration = min_duration = 0
         
@@ -316,11 +680,11 @@ class PerformanceMonitor:
         """Detect performance bottlenecks."""
         bottlenecks = []
         
-        # Check slow operations
-        if self.processing_stats:
-            avg_duration = sum(s.duration for s in self.processing_stats) / len(self.processing_stats)
+        # Check slow operations; only the slowest few can be more than 2x the average
+        if self._op_count:
+            avg_duration = self._dur_sum / self._op_count
             
-            for stat in self.processing_stats:
+            for _, _, stat in sorted(self._slowest, reverse=True):
                 if stat.duration > avg_duration * 2:  # More than 2x average
                     bottlenecks.append({
                         'type': 'slow_operation',
@@ -331,11 +695,10 @@ class PerformanceMonitor:
                     })
         
         # Check memory usage trends
-        recent_metrics = [m for m in self.metrics if m.name == "memory_percent" and 
-                         m.timestamp > time.time() - 3600]  # Last hour
+        recent_values = self.metrics.values_since("memory_percent", time.time() - 3600)  # Last hour
         
-        if len(recent_metrics) > 10:
-            memory_trend = self._calculate_trend([m.value for m in recent_metrics])
+        if len(recent_values) > 10:
+            memory_trend = self._calculate_trend(recent_values)
             if memory_trend > 5:  # Increasing trend
                 bottlenecks.append({
                     'type': 'memory_leak',
@@ -345,30 +708,27 @@ class PerformanceMonitor:
         
         # Check high CPU usage
         current_cpu = self.get_latest_metrics().get("cpu_percent", 0)
-        if current_cpu > self.thresholds['cpu_warning']:
+        if current_cpu > self._th_cpu_warn:
             bottlenecks.append({
                 'type': 'high_cpu',
                 'cpu_percent': current_cpu,
-                'severity': 'critical' if current_cpu > self.thresholds['cpu_critical'] else 'high'
+                'severity': 'critical' if current_cpu > self._th_cpu_crit else 'high'
             })
         
         return bottlenecks
     
     def _calculate_trend(self, values: List[float]) -> float:
         """Calculate trend (slope) of values."""
-        if len(values) < 2:
-            return 0
-        
         n = len(values)
-        x = list(range(n))
+        if n < 2:
+            return 0
         
-        # Calculate linear regression slope
-        sum_x = sum(x)
+        # Least-squares slope against x = 0..n-1 in closed form: with evenly spaced
+        # x, sum(x) and sum(x**2) are known, leaving two C-level passes over values
         sum_y = sum(values)
-        sum_xy = sum(x[i] * values[i] for i in range(n))
-        sum_x2 = sum(x[i] ** 2 for i in range(n))
+        sum_xy = sum(map(operator.mul, range(n), values))
         
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x ** 2)
+        slope = 12 * (sum_xy - (n - 1) / 2 * sum_y) / (n * (n * n - 1))
         return slope
     
     def save_performance_report(self, output_path: str):
@@ -377,12 +737,19 @@ class PerformanceMonitor:
             'generated_at': time.time(),
             'summary': self.get_performance_summary(),
             'bottlenecks': self.detect_performance_bottlenecks(),
-            'recent_metrics': [asdict(m) for m in self.metrics[-100:]],  # Last 100 metrics
-            'operation_stats': [asdict(s) for s in self.processing_stats[-50:]]  # Last 50 operations
+            'recent_metrics': self.metrics.recent_records(100),  # Last 100 metrics
+            'operation_stats': [  # Last 50 operations
+                asdict(s) for s in reversed(list(itertools.islice(reversed(self.processing_stats), 50)))
+            ]
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        # Serialize once and hand the whole report to a 64 KiB buffered writer
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(output_path, 'wb', buffering=64 * 1024) as f:
+            f.write(data)
         
         self.logger.info(f"Performance report saved to {output_path}")
     
@@ -390,38 +757,68 @@ class PerformanceMonitor:
         """Clear old performance data."""
         cutoff_time = time.time() - (days_to_keep * 24 * 60 * 60)
         
-        # Clear old metrics
-        self.metrics = [m for m in self.metrics if m.timestamp > cutoff_time]
+        # Clear old metrics (oldest first, so stop at the first one to keep)
+        self.metrics.drop_older_than(cutoff_time)
+        self.latest = {name: entry for name, entry in list(self.latest.items()) if entry[0] > cutoff_time}
         
         # Clear old processing stats
-        self.processing_stats = [s for s in self.processing_stats if s.end_time > cutoff_time]
+        with self._stats_lock:
+            self.processing_stats = deque(
+                (s for s in self.processing_stats if s.end_time > cutoff_time),
+                maxlen=MAX_PROCESSING_STATS
+            )
+            self._reset_operation_aggregates(self.processing_stats)
         
         self.logger.info(f"Cleared performance data older than {days_to_keep} days")
 
 
-# Global performance monitor instance
-global_performance_monitor = PerformanceMonitor()
+# Global performance monitor instance, created on first use
+_global_monitor: Optional[PerformanceMonitor] = None
+_global_monitor_lock = threading.Lock()
+
+def _get_global_monitor() -> PerformanceMonitor:
+    """Return the shared PerformanceMonitor, creating (and starting) it on first use."""
+    global _global_monitor
+    if _global_monitor is None:
+        with _global_monitor_lock:
+            if _global_monitor is None:
+                _global_monitor = PerformanceMonitor()
+    return _global_monitor
+
+def __getattr__(name: str):
+    # Keep `performance_monitor.global_performance_monitor` working for callers
+    if name == 'global_performance_monitor':
+        return _get_global_monitor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+if MONITOR_ENABLED:
+    # Monitoring starts at import, as before; with PERF_MON=0 nothing is created
+    _get_global_monitor()
 
 def monitor_performance(operation_name: str):
     """Decorator to monitor function performance."""
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            if not MONITOR_ENABLED:
+                return func(*args, **kwargs)
+            
             # Start monitoring
-            operation_id = global_performance_monitor.start_operation(operation_name)
+            monitor = _get_global_monitor()
+            operation_id = monitor.start_operation(operation_name)
             
             try:
                 # Execute function
                 result = func(*args, **kwargs)
                 
                 # End monitoring successfully
-                global_performance_monitor.end_operation(operation_id, operation_name, success=True)
+                monitor.end_operation(operation_id, operation_name, success=True)
                 
                 return result
                 
             except Exception as e:
                 # End monitoring with error
-                global_performance_monitor.end_operation(
+                monitor.end_operation(
                     operation_id, operation_name, success=False, error_message=str(e)
                 )
                 raise
@@ -431,8 +828,8 @@ def monitor_performance(operation_name: str):
 
 def get_performance_summary() -> Dict[str, Any]:
     """Get current performance summary."""
-    return global_performance_monitor.get_performance_summary()
+    return _get_global_monitor().get_performance_summary()
 
 def save_performance_report(output_path: str = "performance_report.json"):
     """Save performance report."""
-    global_performance_monitor.save_performance_report(output_path)
+    _get_global_monitor().save_performance_report(output_path)
@@ -2,13 +2,43 @@
 Section Analysis Tools - Utilities for analyzing extracted section data.
 """
 
+import itertools
 import json
 import logging
+import mmap
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from collections import Counter, defaultdict
+from collections import defaultdict
 import re
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Keywords that mark a sentence as important in extract_key_insights. Plain
+# substrings, as before (so 'key' also matches 'keyword'); matched against the
+# lower-cased sentence, which keeps the case handling identical to str.lower()
+_IMPORTANT_KEYWORDS_RE = re.compile('significant|novel|innovative|breakthrough|important|key|crucial')
+
+# Fields analyze_section_distribution reads from every section, fetched in one C call
+_SECTION_FIELDS = operator.itemgetter('type', 'word_count', 'start_page', 'end_page')
+
+# Threads reading section files in compare_papers_by_sections (the work is mostly I/O)
+MAX_LOAD_WORKERS = 8
+
+# ijson events that carry a scalar value
+_SCALAR_EVENTS = frozenset(('string', 'number', 'boolean', 'null'))
+
 
 class SectionAnalyzer:
     """
@@ -31,12 +61,79 @@ class SectionAnalyzer:
             Optional[Dict[str, Any]]: Section data or None if failed
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            if not ORJSON_AVAILABLE:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            # orjson parses straight from the page cache through a read-only mapping,
+            # without first copying the whole file into a bytes object
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                return orjson.loads(view)
+        except Exception as e:
+            self.logger.error(f"Error loading section data from {file_path}: {str(e)}")
+            return None
+    
+    def load_section_outline(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Load only the title and section types from a section data JSON file.
+        
+        With ijson installed the file is stream-parsed and the section contents,
+        which make up most of the file, are never built into Python objects.
+        
+        Args:
+            file_path (str): Path to section data JSON file
+            
+        Returns:
+            Optional[Dict[str, Any]]: 'title', 'section_count' and 'section_types'
+            (one entry per section, in order), or None if failed or empty
+        """
+        if not IJSON_AVAILABLE:
+            return self.outline_from_data(self.load_section_data(file_path))
+        
+        try:
+            title = 'Unknown'
+            section_count = 0
+            section_types = []
+            has_keys = False
+            with open(file_path, 'rb') as f:
+                for prefix, event, value in ijson.parse(f):
+                    if prefix == 'sections.item.type' and event in _SCALAR_EVENTS:
+                        section_types.append(value)
+                    elif prefix == 'sections.item' and event == 'start_map':
+                        section_count += 1
+                    elif prefix == 'metadata.title' and event in _SCALAR_EVENTS:
+                        title = value
+                    elif prefix == '' and event == 'map_key':
+                        has_keys = True
+            if not has_keys:
+                return None
+            return {'title': title, 'section_count': section_count, 'section_types': section_types}
         except Exception as e:
             self.logger.error(f"Error loading section data from {file_path}: {str(e)}")
             return None
     
+    @staticmethod
+    def outline_from_data(paper_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Build the load_section_outline result from already-loaded section data.
+        
+        Args:
+            paper_data (Optional[Dict[str, Any]]): Section data, or None if loading failed
+            
+        Returns:
+            Optional[Dict[str, Any]]: 'title', 'section_count' and 'section_types',
+            or None if there is no data
+        """
+        if not paper_data:
+            return None
+        sections = paper_data.get('sections', [])
+        return {
+            'title': paper_data.get('metadata', {}).get('title', 'Unknown'),
+            'section_count': len(sections),
+            'section_types': [s['type'] for s in sections]
+        }
+    
     def analyze_section_distribution(self, section_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze the distribution of sections in a paper.
@@ -53,9 +150,9 @@ class SectionAnalyzer:
         sections = section_data['sections']
         analysis = {
             'total_sections': len(sections),
-            'section_types': {},
+            'section_types': defaultdict(int),
             'word_distribution': {},
-            'page_distribution': {},
+            'page_distribution': defaultdict(int),
             'average_section_length': 0,
             'longest_section': None,
             'shortest_section': None
@@ -64,22 +161,27 @@ class SectionAnalyzer:
         total_words = 0
         max_words = 0
         min_words = float('inf')
+        # Running [count, total, min, max] of word counts per section type
+        type_stats = defaultdict(lambda: [0, 0, float('inf'), 0])
         
         for section in sections:
-            section_type = section['type']
-            word_count = section['word_count']
+            section_type, word_count, start_page, end_page = _SECTION_FIELDS(section)
             
             # Count section types
-            analysis['section_types'][section_type] = analysis['section_types'].get(section_type, 0) + 1
+            analysis['section_types'][section_type] += 1
             
             # Word distribution by type
-            if section_type not in analysis['word_distribution']:
-                analysis['word_distribution'][section_type] = []
-            analysis['word_distribution'][section_type].append(word_count)
+            stats = type_stats[section_type]
+            stats[0] += 1
+            stats[1] += word_count
+            if word_count < stats[2]:
+                stats[2] = word_count
+            if word_count > stats[3]:
+                stats[3] = word_count
             
             # Page distribution
-            page_range = f"{section['start_page']}-{section['end_page']}"
-            analysis['page_distribution'][page_range] = analysis['page_distribution'].get(page_range, 0) + 1
+            page_range = f"{start_page}-{end_page}"
+            analysis['page_distribution'][page_range] += 1
             
             # Track longest and shortest sections
             total_words += word_count
@@ -103,31 +205,37 @@ class SectionAnalyzer:
             analysis['average_section_length'] = total_words // len(sections)
             
             # Calculate average word count by section type
-            for section_type in analysis['word_distribution']:
-                word_counts = analysis['word_distribution'][section_type]
+            for section_type, (count, total, min_count, max_count) in type_stats.items():
                 analysis['word_distribution'][section_type] = {
-                    'count': len(word_counts),
-                    'total': sum(word_counts),
-                    'average': sum(word_counts) // len(word_counts),
-                    'min': min(word_counts),
-                    'max': max(word_counts)
+                    'count': count,
+                    'total': total,
+                    'average': total // count,
+                    'min': min_count,
+                    'max': max_count
                 }
         
+        # Plain dicts for callers and JSON serialization
+        analysis['section_types'] = dict(analysis['section_types'])
+        analysis['page_distribution'] = dict(analysis['page_distribution'])
+        
         return analysis
     
-    def compare_papers_by_sections(self, section_files: List[str]) -> Dict[str, Any]:
+    def compare_papers_by_sections(self, section_files: List[str],
+                                   loaded_data: Optional[List[Optional[Dict[str, Any]]]] = None) -> Dict[str, Any]:
         """
         Compare multiple papers based on their section structure.
         
         Args:
             section_files (List[str]): List of section data file paths
+            loaded_data (Optional[List[Optional[Dict[str, Any]]]]): Section data already
+                loaded for section_files, in the same order; the files aren't read again
             
         Returns:
             Dict[str, Any]: Comparison analysis
         """
         comparison = {
             'papers': [],
-            'common_sections': Counter(),
+            'common_sections': {},  # Copy of section_frequency, filled in below
             'section_frequency': defaultdict(int),
             'average_sections_per_paper': 0,
             'section_type_distribution': defaultdict(list)
@@ -135,16 +243,24 @@ class SectionAnalyzer:
         
         total_sections = 0
         
-        for file_path in section_files:
-            paper_data = self.load_section_data(file_path)
-            if not paper_data:
+        # Only titles and section types are needed, not the section contents
+        if loaded_data is not None:
+            outlines = [self.outline_from_data(paper_data) for paper_data in loaded_data]
+        elif len(section_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(section_files), MAX_LOAD_WORKERS)) as executor:
+                outlines = list(executor.map(self.load_section_outline, section_files))
+        else:
+            outlines = [self.load_section_outline(file_path) for file_path in section_files]
+        
+        for file_path, outline in zip(section_files, outlines):
+            if not outline:
                 continue
             
             paper_info = {
                 'file': Path(file_path).name,
-                'title': paper_data.get('metadata', {}).get('title', 'Unknown'),
-                'section_count': len(paper_data.get('sections', [])),
-                'section_types': list(set(s['type'] for s in paper_data.get('sections', [])))
+                'title': outline['title'],
+                'section_count': outline['section_count'],
+                'section_types': list(set(outline['section_types']))
             }
             
             comparison['papers'].append(paper_info)
@@ -153,15 +269,15 @@ class SectionAnalyzer:
             # Track section types
             for section_type in paper_info['section_types']:
                 comparison['section_frequency'][section_type] += 1
-                comparison['common_sections'][section_type] += 1
         
         # Calculate averages
         if comparison['papers']:
             comparison['average_sections_per_paper'] = total_sections / len(comparison['papers'])
         
-        # Convert Counter to regular dict for JSON serialization
-        comparison['common_sections'] = dict(comparison['common_sections'])
+        # Convert to a regular dict for JSON serialization; common_sections holds the
+        # same counts but gets its own copy so the two keys can't alias each other
         comparison['section_frequency'] = dict(comparison['section_frequency'])
+        comparison['common_sections'] = dict(comparison['section_frequency'])
         
         return comparison
     
@@ -189,21 +305,23 @@ class SectionAnalyzer:
                 
                 # Extract important sentences (containing keywords like "significant", "novel", etc.)
                 sentences = section.get('sentences', [])
-                important_sentences = [
-                    s for s in sentences 
-                    if any(keyword in s.lower() for keyword in 
-                          ['significant', 'novel', 'innovative', 'breakthrough', 'important', 'key', 'crucial'])
-                ]
-                insights.extend(important_sentences[:3])  # Top 3 important sentences
+                important_sentences = (s for s in sentences if _IMPORTANT_KEYWORDS_RE.search(s.lower()))
+                insights.extend(itertools.islice(important_sentences, 3))  # Top 3 important sentences
+                
+                if len(insights) >= 10:
+                    break  # Only the first 10 are returned
         
         return insights[:10]  # Return top 10 insights
     
-    def generate_section_summary_report(self, section_data: Dict[str, Any]) -> str:
+    def generate_section_summary_report(self, section_data: Dict[str, Any],
+                                        analysis: Optional[Dict[str, Any]] = None) -> str:
         """
         Generate a human-readable summary report of section analysis.
         
         Args:
             section_data (Dict[str, Any]): Section data
+            analysis (Optional[Dict[str, Any]]): Result of analyze_section_distribution
+                                                 for section_data, if already computed
             
         Returns:
             str: Summary report
@@ -211,7 +329,8 @@ class SectionAnalyzer:
         if not section_data:
             return "No section data available."
         
-        analysis = self.analyze_section_distribution(section_data)
+        if analysis is None:
+            analysis = self.analyze_section_distribution(section_data)
         metadata = section_data.get('metadata', {})
         
         report = f"""
@@ -264,7 +383,7 @@ Section Distribution:
         """
         try:
             analysis = self.analyze_section_distribution(section_data)
-            report = self.generate_section_summary_report(section_data)
+            report = self.generate_section_summary_report(section_data, analysis=analysis)
             
             # Prepare comprehensive report data
             report_data = {
@@ -277,8 +396,12 @@ Section Distribution:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(report_data, f, indent=2, ensure_ascii=False)
             
             # Also save text version
             text_path = output_path.with_suffix('.txt')
@@ -3,14 +3,40 @@ Section-wise text extraction module for research papers.
 Enhances the existing text extraction with intelligent section detection and analysis.
 """
 
+import heapq
 import re
 import json
 import logging
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from paper_retrieval.text_extractor import PDFTextExtractor
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Common words ignored by key phrase extraction
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'
+})
+
+# Page marker lines that PDFTextExtractor puts into full_text ("--- Page N ---")
+PAGE_MARKER = "--- Page"
+_PAGE_NUMBER_RE = re.compile(r'Page (\d+)')
+
+# Sentence boundaries for _split_sentences
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
 
 @dataclass
 class Section:
@@ -23,7 +49,9 @@ class Section:
     word_count: int = 0
     
     def __post_init__(self):
-        self.word_count = len(self.content.split())
+        # Count only if the caller didn't already know the word count
+        if not self.word_count:
+            self.word_count = len(self.content.split())
 
 
 class SectionWiseExtractor:
@@ -32,10 +60,16 @@ class SectionWiseExtractor:
     Provides intelligent section detection and structured storage for analysis.
     """
     
-    def __init__(self):
-        """Initialize the section-wise extractor."""
+    def __init__(self, page_workers: int = 1):
+        """
+        Initialize the section-wise extractor.
+        
+        Args:
+            page_workers (int): Passed on to PDFTextExtractor; values above 1 split
+                                large PDFs across per-page worker processes
+        """
         self.logger = logging.getLogger(__name__)
-        self.base_extractor = PDFTextExtractor()
+        self.base_extractor = PDFTextExtractor(page_workers=page_workers)
         
         # Common section patterns in research papers
         self.section_patterns = {
@@ -95,6 +129,18 @@ class SectionWiseExtractor:
                 r'^a\s+appendix\s*$'
             ]
         }
+        
+        # All header patterns fused into one regex with a named group per section
+        # type, so each line is tried with a single match call. Branches keep the
+        # order above, so the first matching type still wins (e.g. 'summary')
+        self._header_re = re.compile(
+            '|'.join(
+                f"(?P<{section_type}>{'|'.join(patterns)})"
+                for section_type, patterns in self.section_patterns.items()
+            ),
+            re.IGNORECASE
+        )
+        self._numbered_re = re.compile(r'^(\d+|[ivx]+)\.?\s+(.+)$')
     
     def detect_sections_from_text(self, full_text: str) -> List[Section]:
         """
@@ -121,74 +167,145 @@ class SectionWiseExtractor:
         Returns:
             List[Section]: Detected sections
         """
-        sections = []
-        lines = full_text.split('\n')
+        return list(self.iter_sections(full_text))
+    
+    def iter_sections(self, full_text: str) -> Iterator[Section]:
+        """
+        Detect sections in the research paper text, yielding each one as soon as it closes.
+        
+        The text is split into lines one page at a time, so the whole paper is
+        never held as a list of lines alongside full_text.
+        
+        Args:
+            full_text (str): Full text of the paper
+            
+        Yields:
+            Section: Detected sections, in document order
+        """
         current_section = None
-        current_content = []
-        current_start_page = 1
         
-        # Find page number for each line
-        line_to_page = {}
+        # Section content is sliced out of full_text rather than collected line by
+        # line: runs of content lines are contiguous in the text, so a section is
+        # the '\n'-join of its runs (page markers split a run), usually just one
+        spans = []  # (start, end) offsets of the current section's finished runs
+        run_start = 0  # Offset where the current run of content lines begins
+        offset = 0  # Offset of the current line
+        
         current_page = 1
-        page_text_index = 0
-        
-        for i, line in enumerate(lines):
-            # Update current page based on page markers
-            if "--- Page" in line:
-                page_match = re.search(r'Page (\d+)', line)
-                if page_match:
-                    current_page = int(page_match.group(1))
-                continue
-            
-            line_to_page[i] = current_page
+        last_line_is_marker = False
+        identify = self._identify_lowered
         
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
-            
-            # Skip page markers
-            if "--- Page" in line_stripped:
-                continue
+        # Walk the text page by page between the page markers, so content lines are
+        # never checked for being a marker; a sentinel past the end closes the tail
+        text_end = len(full_text)
+        page_markers = self._find_page_markers(full_text)
+        for marker_start, marker_end, marker_page in [*page_markers, (text_end + 1, text_end, None)]:
+            # Lines before the marker line, without the newline that ends the last one
+            segment_lines = full_text[offset:marker_start - 1].split('\n') if offset < marker_start else []
+            for line in segment_lines:
+                next_offset = offset + len(line) + 1
+                line_stripped = line.strip()
+                
+                # Check if this line matches a section header (lower-cased once, here)
+                section_type, confidence = identify(line_stripped.lower())
+                
+                if confidence > 0.7:  # High confidence section header
+                    # Emit previous section if exists
+                    if current_section:
+                        if run_start < offset:
+                            spans.append((run_start, offset - 1))
+                        content = self._join_spans(full_text, spans)
+                        if content:
+                            yield Section(
+                                title=current_section['title'],
+                                content=content,
+                                start_page=current_section['start_page'],
+                                end_page=current_page,
+                                section_type=current_section['type']
+                            )
+                    
+                    # Start new section
+                    current_section = {
+                        'title': line_stripped,
+                        'type': section_type,
+                        'start_page': current_page
+                    }
+                    spans = []
+                    run_start = next_offset
+                
+                offset = next_offset
             
-            # Check if this line matches a section header
-            section_type, confidence = self._identify_section_type(line_stripped)
+            if marker_start > text_end:
+                break
             
-            if confidence > 0.7:  # High confidence section header
-                # Save previous section if exists
-                if current_section:
-                    content = '\n'.join(current_content).strip()
-                    if content:
-                        sections.append(Section(
-                            title=current_section['title'],
-                            content=content,
-                            start_page=current_section['start_page'],
-                            end_page=line_to_page.get(i, current_section['start_page']),
-                            section_type=current_section['type']
-                        ))
-                
-                # Start new section
-                current_section = {
-                    'title': line_stripped,
-                    'type': section_type,
-                    'start_page': line_to_page.get(i, 1)
-                }
-                current_content = []
-            elif current_section:
-                # Add content to current section
-                current_content.append(line)
-        
-        # Save the last section
-        if current_section and current_content:
-            content = '\n'.join(current_content).strip()
+            # Update current page based on page markers, which are not content
+            if run_start < offset:
+                spans.append((run_start, offset - 1))
+            offset = marker_end + 1
+            run_start = offset
+            if marker_page is not None:
+                current_page = marker_page
+            last_line_is_marker = marker_end == text_end
+        
+        # Emit the last section; it ends on the page of the last line, unless that
+        # line is a page marker
+        if current_section:
+            if run_start < offset:
+                spans.append((run_start, text_end))
+            content = self._join_spans(full_text, spans)
             if content:
-                sections.append(Section(
+                yield Section(
                     title=current_section['title'],
                     content=content,
                     start_page=current_section['start_page'],
-                    end_page=line_to_page.get(len(lines) - 1, current_section['start_page']),
+                    end_page=current_section['start_page'] if last_line_is_marker else current_page,
                     section_type=current_section['type']
-                ))
+                )
+    
+    @staticmethod
+    def _join_spans(full_text: str, spans: List[Tuple[int, int]]) -> str:
+        """
+        Build a section's content from its runs of lines in full_text.
         
-        return sections
+        Args:
+            full_text (str): Full text of the paper
+            spans (List[Tuple[int, int]]): (start, end) offsets of the section's runs
+            
+        Returns:
+            str: The runs joined by newlines, stripped
+        """
+        if len(spans) == 1:
+            # A section that doesn't cross a page marker is one slice, no join needed
+            start, end = spans[0]
+            return full_text[start:end].strip()
+        return '\n'.join([full_text[start:end] for start, end in spans]).strip()
+    
+    def _find_page_markers(self, full_text: str) -> List[Tuple[int, int, Optional[int]]]:
+        """
+        Locate the page marker lines in the text with C-level substring searches.
+        
+        Args:
+            full_text (str): Full text of the paper
+            
+        Returns:
+            List[Tuple[int, int, Optional[int]]]: (start, end) offsets of each marker
+                                                  line, in order, and the page number
+                                                  it announces (None if it has no number)
+        """
+        markers = []
+        pos = full_text.find(PAGE_MARKER)
+        while pos != -1:
+            line_start = full_text.rfind('\n', 0, pos) + 1
+            line_end = full_text.find('\n', pos)
+            if line_end == -1:
+                line_end = len(full_text)
+            
+            page_match = _PAGE_NUMBER_RE.search(full_text, line_start, line_end)
+            markers.append((line_start, line_end, int(page_match.group(1)) if page_match else None))
+            
+            # At most one marker per line; continue on the next one
+            pos = full_text.find(PAGE_MARKER, line_end)
+        return markers
     
     def _identify_section_type(self, line: str) -> Tuple[str, float]:
         """
@@ -200,22 +317,21 @@ class SectionWiseExtractor:
         Returns:
             Tuple[str, float]: Section type and confidence score
         """
-        line_lower = line.lower()
-        
-        for section_type, patterns in self.section_patterns.items():
-            for pattern in patterns:
-                if re.match(pattern, line_lower, re.IGNORECASE):
-                    return section_type, 1.0
+        return self._identify_lowered(line.lower())
+    
+    def _identify_lowered(self, line_lower: str) -> Tuple[str, float]:
+        """_identify_section_type for a line that is already lower-cased."""
+        match = self._header_re.match(line_lower)
+        if match:
+            return match.lastgroup, 1.0
         
         # Check for numbered sections (e.g., "1. Introduction", "2. Methodology")
-        numbered_pattern = r'^(\d+|[ivx]+)\.?\s+(.+)$'
-        match = re.match(numbered_pattern, line_lower)
+        match = self._numbered_re.match(line_lower)
         if match:
-            section_title = match.group(2)
-            for section_type, patterns in self.section_patterns.items():
-                for pattern in patterns:
-                    if re.search(pattern, section_title, re.IGNORECASE):
-                        return section_type, 0.8
+            # Every pattern is anchored with ^, so match() is what search() did
+            header_match = self._header_re.match(match.group(2))
+            if header_match:
+                return header_match.lastgroup, 0.8
         
         return "unknown", 0.0
     
@@ -236,12 +352,6 @@ class SectionWiseExtractor:
             if not extracted_data:
                 return None
             
-            # Detect sections
-            sections = self.detect_sections(
-                extracted_data['full_text'], 
-                extracted_data['page_texts']
-            )
-            
             # Prepare section-wise data
             section_data = {
                 'metadata': extracted_data['metadata'],
@@ -250,8 +360,10 @@ class SectionWiseExtractor:
                 'extraction_success': True
             }
             
-            # Process each section
-            for section in sections:
+            # Detect sections and process each one as soon as the detector closes it
+            sections = []
+            for section in self.iter_sections(extracted_data['full_text']):
+                sections.append(section)
                 section_dict = {
                     'title': section.title,
                     'type': section.section_type,
@@ -289,24 +401,13 @@ class SectionWiseExtractor:
         # This can be enhanced with NLP techniques
         words = text.lower().split()
         
-        # Filter out common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'
-        }
-        
-        # Filter words and count frequency
-        filtered_words = [word for word in words if len(word) > 3 and word not in stop_words]
-        word_freq = {}
+        # Filter out stop words and count frequency; Counter does the counting in C
+        word_freq = Counter(word for word in words if len(word) > 3 and word not in STOP_WORDS)
         
-        for word in filtered_words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # Return top phrases
-        top_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, count in top_words[:max_phrases]]
+        # Return top phrases; a heap keeps only max_phrases entries instead of sorting
+        # every distinct word (ties stay in first-seen order, as with a stable sort)
+        top_words = heapq.nlargest(max_phrases, word_freq.items(), key=operator.itemgetter(1))
+        return [word for word, count in top_words]
     
     def _split_sentences(self, text: str) -> List[str]:
         """
@@ -318,9 +419,23 @@ class SectionWiseExtractor:
         Returns:
             List[str]: Sentences
         """
+        return list(self._iter_sentences(text))
+    
+    def _iter_sentences(self, text: str) -> Iterator[str]:
+        """
+        Lazily split text into sentences, for callers that only need the first few.
+        
+        Args:
+            text (str): Section content
+            
+        Yields:
+            str: Non-empty, stripped sentences in order
+        """
         # Simple sentence splitting
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        for sentence in _SENTENCE_SPLIT_RE.split(text):
+            sentence = sentence.strip()
+            if sentence:
+                yield sentence
     
     def _create_section_summary(self, sections: List[Section]) -> Dict[str, Any]:
         """
@@ -334,23 +449,37 @@ class SectionWiseExtractor:
         """
         summary = {
             'total_sections': len(sections),
-            'section_types': {},
+            'section_types': defaultdict(int),
             'total_words': 0,
             'page_coverage': {}
         }
+        # +1 where a section's page range opens, -1 one page past its end
+        coverage_edges = defaultdict(int)
         
         for section in sections:
             # Count section types
             section_type = section.section_type
-            summary['section_types'][section_type] = summary['section_types'].get(section_type, 0) + 1
+            summary['section_types'][section_type] += 1
             
             # Total word count
             summary['total_words'] += section.word_count
             
             # Page coverage
-            for page in range(section.start_page, section.end_page + 1):
-                summary['page_coverage'][page] = summary['page_coverage'].get(page, 0) + 1
+            if section.end_page >= section.start_page:
+                coverage_edges[section.start_page] += 1
+                coverage_edges[section.end_page + 1] -= 1
         
+        # Sweep the range edges once instead of stepping every section page by page
+        edges = sorted(coverage_edges)
+        page_coverage = summary['page_coverage']
+        covering = 0
+        for page, next_edge in zip(edges, edges[1:]):
+            covering += coverage_edges[page]
+            if covering:
+                for covered_page in range(page, next_edge):
+                    page_coverage[covered_page] = covering
+        
+        summary['section_types'] = dict(summary['section_types'])
         return summary
     
     def save_section_data(self, section_data: Dict[str, Any], output_path: str) -> bool:
@@ -368,8 +497,13 @@ class SectionWiseExtractor:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(section_data, f, indent=2, ensure_ascii=False)
+            # page_coverage in the summary has int keys, hence OPT_NON_STR_KEYS
+            if ORJSON_AVAILABLE:
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(section_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(section_data, f, indent=2, ensure_ascii=False)
             
             self.logger.info(f"Saved section data to {output_path}")
             return True
@@ -396,29 +530,69 @@ class SectionWiseExtractor:
             self.logger.error(f"PDF directory not found: {pdf_dir}")
             return {'success': [], 'failed': [], 'total': 0}
         
-        pdf_files = list(pdf_path.glob("*.pdf"))
+        # scandir hands back names and paths straight from the directory listing
+        with os.scandir(pdf_path) as entries:
+            pdf_files = [entry for entry in entries if entry.name.endswith('.pdf') and entry.is_file()]
         results = {'success': [], 'failed': [], 'total': len(pdf_files)}
+        output_paths = [os.path.join(output_dir, f"{entry.name[:-len('.pdf')]}_sections.json") for entry in pdf_files]
         
-        for pdf_file in pdf_files:
-            self.logger.info(f"Processing sections for: {pdf_file.name}")
-            
-            section_data = self.extract_sections_from_pdf(str(pdf_file))
-            
+        # Each PDF is independent and CPU-bound, so spread them over processes
+        max_workers = max(1, min(len(pdf_files), os.cpu_count() or 1))
+        if max_workers == 1:
+            outcomes = []
+            for pdf_file, output_path in zip(pdf_files, output_paths):
+                self.logger.info(f"Processing sections for: {pdf_file.name}")
+                section_data = self.extract_sections_from_pdf(pdf_file.path)
+                if section_data:
+                    self.save_section_data(section_data, output_path)
+                outcomes.append(section_data)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = []
+                for pdf_file, output_path in zip(pdf_files, output_paths):
+                    self.logger.info(f"Processing sections for: {pdf_file.name}")
+                    futures.append(executor.submit(_process_one_pdf, pdf_file.path, output_path))
+                outcomes = [self._future_result(future) for future in futures]
+        
+        for pdf_file, section_data in zip(pdf_files, outcomes):
             if section_data:
                 results['success'].append({
                     'file': pdf_file.name,
                     'sections_found': len(section_data['sections']),
                     'data': section_data
                 })
-                
-                # Save section data
-                output_path = Path(output_dir) / f"{pdf_file.stem}_sections.json"
-                self.save_section_data(section_data, str(output_path))
             else:
                 results['failed'].append(pdf_file.name)
         
         self.logger.info(f"Section processing complete: {len(results['success'])} successful, {len(results['failed'])} failed")
         return results
+    
+    def _future_result(self, future) -> Optional[Dict[str, Any]]:
+        """Return a worker's section data, logging worker crashes as failures."""
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.error(f"Section extraction worker failed: {str(e)}")
+            return None
+
+
+def _process_one_pdf(pdf_path: str, output_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract sections from one PDF and save them. Module-level so worker processes can unpickle it.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        output_path (str): Where to save the section data
+        
+    Returns:
+        Optional[Dict[str, Any]]: Section data or None if extraction failed
+    """
+    # Already running one process per file, so don't fan out per page as well
+    extractor = SectionWiseExtractor(page_workers=1)
+    section_data = extractor.extract_sections_from_pdf(pdf_path)
+    if section_data:
+        extractor.save_section_data(section_data, output_path)
+    return section_data
 
 
 # Convenience functions
@@ -437,18 +611,20 @@ def extract_sections_from_pdf(pdf_path: str) -> Optional[Dict[str, Any]]:
 
 
 def process_all_pdfs_for_sections(pdf_dir: str = "Downloaded_pdfs", 
-                                 output_dir: str = "data/section_analysis") -> Dict[str, Any]:
+                                 output_dir: str = "data/section_analysis",
+                                 page_workers: int = 1) -> Dict[str, Any]:
     """
     Convenience function to process all PDFs for section analysis.
     
     Args:
         pdf_dir (str): Directory containing PDF files
         output_dir (str): Directory to save section analysis
+        page_workers (int): Per-page worker processes for PDFs extracted in-process
         
     Returns:
         Dict[str, Any]: Processing results
     """
-    extractor = SectionWiseExtractor()
+    extractor = SectionWiseExtractor(page_workers=page_workers)
     return extractor.process_pdfs_for_sections(pdf_dir, output_dir)
 
 
@@ -22,14 +22,28 @@ Examples:
 """
 
 import argparse
+import functools
+import io
 import json
 import logging
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-from section_extractor import SectionWiseExtractor, extract_sections_from_pdf, process_all_pdfs_for_sections
-from section_analyzer import SectionAnalyzer, analyze_paper_sections, generate_paper_report
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from section_extractor import SectionWiseExtractor, process_all_pdfs_for_sections
+from section_analyzer import SectionAnalyzer, generate_paper_report, MAX_LOAD_WORKERS
+
+# Papers whose analysis lines are collected before each write to stdout
+PRINT_BATCH_PAPERS = 50
 
 
 def setup_logging(verbose: bool = False):
@@ -45,6 +59,12 @@ def setup_logging(verbose: bool = False):
     )
 
 
+@functools.cache
+def _shared_analyzer() -> SectionAnalyzer:
+    """The SectionAnalyzer reused by every command (one per process; it holds no per-paper state)."""
+    return SectionAnalyzer()
+
+
 def process_single_pdf(pdf_path: str, output_dir: str = "data/section_analysis") -> bool:
     """
     Process a single PDF file for section extraction.
@@ -64,11 +84,12 @@ def process_single_pdf(pdf_path: str, output_dir: str = "data/section_analysis")
     
     logger.info(f"Processing single PDF: {pdf_path}")
     
-    section_data = extract_sections_from_pdf(pdf_path)
+    # One extractor both extracts and saves
+    extractor = SectionWiseExtractor()
+    section_data = extractor.extract_sections_from_pdf(pdf_path)
     
     if section_data:
         # Save section data
-        extractor = SectionWiseExtractor()
         pdf_name = Path(pdf_path).stem
         output_path = Path(output_dir) / f"{pdf_name}_sections.json"
         
@@ -76,7 +97,7 @@ def process_single_pdf(pdf_path: str, output_dir: str = "data/section_analysis")
             logger.info(f"Section data saved to {output_path}")
             
             # Generate analysis report
-            analyzer = SectionAnalyzer()
+            analyzer = _shared_analyzer()
             report_path = output_path.with_suffix('.report.json')
             analyzer.save_analysis_report(section_data, str(report_path))
             
@@ -106,7 +127,8 @@ def process_all_pdfs(pdf_dir: str = "Downloaded_pdfs",
     
     logger.info(f"Processing all PDFs in {pdf_dir}")
     
-    results = process_all_pdfs_for_sections(pdf_dir, output_dir)
+    # Run from the command line, so large PDFs may fan out across worker processes
+    results = process_all_pdfs_for_sections(pdf_dir, output_dir, page_workers=os.cpu_count() or 1)
     
     # Print results summary
     print(f"\n{'='*60}")
@@ -129,23 +151,94 @@ def process_all_pdfs(pdf_dir: str = "Downloaded_pdfs",
     # Generate analysis reports for successful extractions
     if results['success']:
         print(f"\nGenerating analysis reports...")
-        analyzer = SectionAnalyzer()
-        
+        report_jobs = []
         for success in results['success']:
             pdf_name = Path(success['file']).stem
             section_file = Path(output_dir) / f"{pdf_name}_sections.json"
             
             if section_file.exists():
-                report_path = section_file.with_suffix('.report.json')
-                section_data = analyzer.load_section_data(str(section_file))
-                
-                if section_data:
-                    analyzer.save_analysis_report(section_data, str(report_path))
-                    print(f"  - Report generated for {success['file']}")
+                report_jobs.append((success['file'], str(section_file)))
+        
+        # Reports are independent per paper, so spread them over processes
+        section_files = [section_file for _, section_file in report_jobs]
+        max_workers = max(1, min(len(section_files), os.cpu_count() or 1))
+        if max_workers == 1:
+            generated = [generate_section_report(section_file) for section_file in section_files]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                generated = list(executor.map(generate_section_report, section_files))
+        
+        for (file_name, _), report_generated in zip(report_jobs, generated):
+            if report_generated:
+                print(f"  - Report generated for {file_name}")
     
     return len(results['success']) > 0
 
 
+def generate_section_report(section_file: str) -> bool:
+    """
+    Generate the analysis report for one saved section data file.
+    
+    Module-level, using the per-process shared SectionAnalyzer, so it can run in a
+    worker process.
+    
+    Args:
+        section_file (str): Path to the section data JSON file
+        
+    Returns:
+        bool: True if the section data was loaded and the report written
+    """
+    analyzer = _shared_analyzer()
+    section_data = analyzer.load_section_data(section_file)
+    
+    if not section_data:
+        return False
+    
+    report_path = Path(section_file).with_suffix('.report.json')
+    analyzer.save_analysis_report(section_data, str(report_path))
+    return True
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_section_data(section_file: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Load a section data file once per modification time (mtime_ns is only the cache key)."""
+    return _shared_analyzer().load_section_data(section_file)
+
+
+def load_section_data_cached(section_file: str, mtime_ns: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Load section data, reusing the parsed data if the file hasn't changed since.
+    
+    Args:
+        section_file (str): Path to the section data JSON file
+        mtime_ns (Optional[int]): The file's st_mtime_ns if already known (stat'ed if not)
+        
+    Returns:
+        Optional[Dict[str, Any]]: Section data or None if failed
+    """
+    if mtime_ns is None:
+        try:
+            mtime_ns = os.stat(section_file).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+    return _cached_section_data(section_file, mtime_ns)
+
+
+def scan_section_files(data_dir: str) -> List[os.DirEntry]:
+    """
+    List the *_sections.json files in a directory in one scandir pass.
+    
+    Args:
+        data_dir (str): Directory containing section data files
+        
+    Returns:
+        List[os.DirEntry]: Directory entries of the section data files, in listing order
+    """
+    # The file type comes with the directory listing, so only entry.stat() costs a syscall
+    with os.scandir(data_dir) as entries:
+        return [entry for entry in entries if entry.name.endswith('_sections.json') and entry.is_file()]
+
+
 def analyze_existing_data(data_dir: str = "data/section_analysis") -> None:
     """
     Analyze existing section data and generate comprehensive reports.
@@ -161,7 +254,7 @@ def analyze_existing_data(data_dir: str = "data/section_analysis") -> None:
         return
     
     # Find all section files
-    section_files = list(data_path.glob("*_sections.json"))
+    section_files = scan_section_files(data_dir)
     
     if not section_files:
         logger.info(f"No section files found in {data_dir}")
@@ -172,23 +265,39 @@ def analyze_existing_data(data_dir: str = "data/section_analysis") -> None:
     print(f"{'='*60}")
     print(f"Found {len(section_files)} papers with section data")
     
-    analyzer = SectionAnalyzer()
+    analyzer = _shared_analyzer()
+    
+    # Read the files with several reads in flight at once, warming the load cache
+    # that both passes below are served from
+    if len(section_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(section_files), MAX_LOAD_WORKERS)) as executor:
+            for section_file in section_files:
+                executor.submit(load_section_data_cached, section_file.path, section_file.stat().st_mtime_ns)
     
-    # Analyze each paper
+    # Analyze each paper; the per-paper lines are buffered and written in batches
     all_analyses = []
-    for section_file in section_files:
-        print(f"\nAnalyzing: {section_file.name}")
+    output = io.StringIO()
+    for paper_index, section_file in enumerate(section_files, 1):
+        output.write(f"\nAnalyzing: {section_file.name}\n")
         
-        analysis = analyze_paper_sections(str(section_file))
+        # Loaded through the cache, so the comparison below doesn't parse the file again
+        analysis = analyzer.analyze_section_distribution(
+            load_section_data_cached(section_file.path, section_file.stat().st_mtime_ns)
+        )
         if analysis:
             all_analyses.append({
                 'file': section_file.name,
                 'analysis': analysis
             })
             
-            print(f"  - Sections: {analysis.get('total_sections', 0)}")
-            print(f"  - Types: {', '.join(analysis.get('section_types', {}).keys())}")
-            print(f"  - Average length: {analysis.get('average_section_length', 0)} words")
+            output.write(f"  - Sections: {analysis.get('total_sections', 0)}\n")
+            output.write(f"  - Types: {', '.join(analysis.get('section_types', {}).keys())}\n")
+            output.write(f"  - Average length: {analysis.get('average_section_length', 0)} words\n")
+        
+        if paper_index % PRINT_BATCH_PAPERS == 0 or paper_index == len(section_files):
+            sys.stdout.write(output.getvalue())
+            sys.stdout.flush()
+            output = io.StringIO()
     
     # Generate comparison report
     if len(all_analyses) > 1:
@@ -196,21 +305,30 @@ def analyze_existing_data(data_dir: str = "data/section_analysis") -> None:
         print("Comparative Analysis")
         print(f"{'='*60}")
         
-        comparison = analyzer.compare_papers_by_sections([str(f) for f in section_files])
+        comparison = analyzer.compare_papers_by_sections(
+            [f.path for f in section_files],
+            loaded_data=[load_section_data_cached(f.path, f.stat().st_mtime_ns) for f in section_files]
+        )
         
         print(f"Average sections per paper: {comparison.get('average_sections_per_paper', 0):.1f}")
         print(f"\nCommon section types:")
-        for section_type, frequency in sorted(comparison.get('section_frequency', {}).items(), 
-                                            key=lambda x: x[1], reverse=True):
+        for section_type, frequency in Counter(comparison.get('section_frequency', {})).most_common():
             percentage = (frequency / len(all_analyses)) * 100
             print(f"  - {section_type.title()}: {frequency}/{len(all_analyses)} papers ({percentage:.1f}%)")
         
         # Save comparison report
         comparison_path = data_path / "comparison_report.json"
-        with open(comparison_path, 'w', encoding='utf-8') as f:
-            json.dump(comparison, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            with open(comparison_path, 'wb') as f:
+                f.write(orjson.dumps(comparison, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(comparison_path, 'w', encoding='utf-8') as f:
+                json.dump(comparison, f, indent=2, ensure_ascii=False)
         
         print(f"\nComparison report saved to {comparison_path}")
+    
+    # The parsed files are only shared within this one command
+    _cached_section_data.cache_clear()
 
 
 def compare_papers(data_dir: str = "data/section_analysis") -> None:
@@ -227,14 +345,14 @@ def compare_papers(data_dir: str = "data/section_analysis") -> None:
         logger.error(f"Data directory not found: {data_dir}")
         return
     
-    section_files = list(data_path.glob("*_sections.json"))
+    section_files = scan_section_files(data_dir)
     
     if len(section_files) < 2:
         logger.info("Need at least 2 papers to compare")
         return
     
-    analyzer = SectionAnalyzer()
-    comparison = analyzer.compare_papers_by_sections([str(f) for f in section_files])
+    analyzer = _shared_analyzer()
+    comparison = analyzer.compare_papers_by_sections([f.path for f in section_files])
     
     print(f"\n{'='*60}")
     print("Paper Comparison Report")
@@ -249,8 +367,7 @@ def compare_papers(data_dir: str = "data/section_analysis") -> None:
         print(f"    Types: {', '.join(paper['section_types'])}")
     
     print(f"\nSection Frequency Analysis:")
-    for section_type, frequency in sorted(comparison.get('section_frequency', {}).items(), 
-                                        key=lambda x: x[1], reverse=True):
+    for section_type, frequency in Counter(comparison.get('section_frequency', {})).most_common():
         percentage = (frequency / len(comparison['papers'])) * 100
         print(f"  - {section_type.title()}: {frequency}/{len(comparison['papers'])} papers ({percentage:.1f}%)")
 
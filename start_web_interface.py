@@ -4,11 +4,17 @@ AI Research Agent Web Interface Launcher
 Simple script to start the web interface with proper setup
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
+import sysconfig
 from pathlib import Path
 
+# Marks a passed dependency check and records which interpreter it was for; valid
+# for that interpreter until its site-packages changes again
+DEPS_SENTINEL = Path(__file__).resolve().parent / '.deps_ok'
+
 # Fix Windows console encoding for Unicode characters
 try:
     from utils.encoding_fix import fix_console_encoding
@@ -24,13 +30,24 @@ except ImportError:
 
 def check_dependencies():
     """Check if required dependencies are installed"""
+    # pip install/uninstall updates site-packages' mtime, so a sentinel written for
+    # this interpreter and newer than its site-packages means nothing has changed
+    # since the last successful check
+    site_packages = Path(sysconfig.get_paths()['purelib'])
+    interpreter = f"{sys.prefix}\n{site_packages}\n"
+    try:
+        if (DEPS_SENTINEL.read_text(encoding='utf-8') == interpreter
+                and DEPS_SENTINEL.stat().st_mtime >= site_packages.stat().st_mtime):
+            return True
+    except OSError:
+        pass
+    
     required_packages = ['flask', 'flask_socketio', 'psutil']
     missing_packages = []
     
+    # Look the packages up without importing them; web_app imports them for real later
     for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
+        if importlib.util.find_spec(package.replace('-', '_')) is None:
             missing_packages.append(package)
     
     if missing_packages:
@@ -49,6 +66,11 @@ def check_dependencies():
             print(f"   pip install {' '.join(missing_packages)}")
             return False
     
+    try:
+        DEPS_SENTINEL.write_text(interpreter, encoding='utf-8')
+    except OSError:
+        pass  # Read-only checkout; just check again next launch
+    
     return True
 
 def setup_directories():
@@ -62,8 +84,19 @@ def setup_directories():
         'data/section_analysis'
     ]
     
+    # Create every directory and shared parent (static/, data/) once, parents first
+    needed = set()
     for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+        path = Path(directory)
+        needed.add(path)
+        needed.update(path.parents[:-1])  # Skip the trailing '.'
+    
+    for path in sorted(needed, key=lambda p: len(p.parts)):
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            if not path.is_dir():
+                raise
     
     print("✅ Directory structure ready!")
 